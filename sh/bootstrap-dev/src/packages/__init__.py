@@ -17,20 +17,7 @@ Internal modules:
     - scripts: Automation and utility scripts
 """
 
-# Main public API
-from .core import InfrastructureBootstrap
-
-# Commonly used utilities
-from .utils import Colors
-
-# Manager classes (for advanced usage)
-from .managers import ComponentManager, ConfigManager, StateManager, PluginSystem
-
-# Operations (for advanced usage)
-from .operations import Doctor, YAMLOperations
-
-# Presentation layer (for custom formatting)
-from .presentation import StatePresenter, ComponentPresenter, ProfilePresenter
+from ._lazy import lazy_exports
 
 __all__ = [
     # Primary public API
@@ -55,3 +42,23 @@ __all__ = [
 
 # Version info
 __version__ = '1.0.0'
+
+# Exported name -> submodule. The public API is resolved on first access so
+# that importing one subpackage (e.g. the CLI) does not load every manager,
+# operation and presenter in the tree.
+_EXPORTS = {
+    'InfrastructureBootstrap': '.core',
+    'Colors': '.utils',
+    'ComponentManager': '.managers',
+    'ConfigManager': '.managers',
+    'StateManager': '.managers',
+    'PluginSystem': '.managers',
+    'Doctor': '.operations',
+    'YAMLOperations': '.operations',
+    'StatePresenter': '.presentation',
+    'ComponentPresenter': '.presentation',
+    'ProfilePresenter': '.presentation',
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,41 @@
+"""Lazy attribute exports for package __init__ modules.
+
+Kept free of package imports so that every __init__ can use it without
+loading anything else in the tree.
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module __getattr__ and __dir__ that import exports on first access.
+
+    Usage in a package __init__::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"Name": ".submodule"})
+
+    Args:
+        package: __name__ of the package exporting the names
+        exports: Exported name -> relative submodule that defines it
+
+    Returns:
+        (__getattr__, __dir__) for the package module
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -5,28 +5,7 @@ hashing, logging, and external system integrations. These adapters isolate
 domain logic from implementation details.
 """
 
-from .fs import (
-    atomic_write,
-    safe_mkdir,
-    staging,
-    cleanup_staging,
-)
-from .hashing import (
-    sha256_file,
-    sha256_content,
-    verify_hash,
-)
-from .logging import (
-    get_logger,
-    configure_logging,
-)
-from .receipts import (
-    Receipt,
-    ReceiptsAdapter,
-)
-from .yaml_ops import (
-    YamlOpsAdapter,
-)
+from .._lazy import lazy_exports
 
 __all__ = [
     # Filesystem operations
@@ -47,3 +26,24 @@ __all__ = [
     # YAML operations
     "YamlOpsAdapter",
 ]
+
+# Exported name -> submodule. Resolved on first access so that the CLI can
+# configure logging without loading the receipt, filesystem and YAML
+# validation adapters.
+_EXPORTS = {
+    "atomic_write": ".fs",
+    "safe_mkdir": ".fs",
+    "staging": ".fs",
+    "cleanup_staging": ".fs",
+    "sha256_file": ".hashing",
+    "sha256_content": ".hashing",
+    "verify_hash": ".hashing",
+    "get_logger": ".logging",
+    "configure_logging": ".logging",
+    "Receipt": ".receipts",
+    "ReceiptsAdapter": ".receipts",
+    "YamlOpsAdapter": ".yaml_ops",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
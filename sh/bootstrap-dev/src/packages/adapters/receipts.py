@@ -158,11 +158,20 @@ class ReceiptsAdapter:
             # Convert FileAction list to dict format
             if hasattr(receipt, 'files') and receipt.files:
                 for action in receipt.files:
-                    receipt_data["files"][str(action.target_path)] = {
+                    file_data = {
                         "hash": action.target_hash,
                         "action": action.action_type,
                         "source": str(action.source_path)
                     }
+                    # Installed size lets doctor report a resized file as
+                    # drifted without hashing it
+                    if action.target_hash:
+                        installed_path = self.target_dir / action.target_path
+                        try:
+                            file_data["size"] = installed_path.stat().st_size
+                        except OSError:
+                            pass
+                    receipt_data["files"][str(action.target_path)] = file_data
         else:
             # Adapter Receipt - use as is
             receipt_data = receipt.to_dict()
@@ -5,11 +5,16 @@ YAML merging, JSON operations, and template processing. All file content edits
 go through this adapter to ensure consistency and safety.
 """
 
+import copy
+import functools
+import io
 import json
 import re
+import shutil
 import yaml
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..domain.constants import (
     YAML_EXTENSIONS,
@@ -21,6 +26,115 @@ from ..adapters.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+    logger.warning(
+        "libyaml bindings not available, using pure-Python YAML parser "
+        "(install libyaml-dev and reinstall PyYAML for faster YAML operations)"
+    )
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+
+try:
+    import ijson
+
+    _HAS_IJSON = True
+except ImportError:
+    ijson = None
+    _HAS_IJSON = False
+
+try:
+    import jinja2
+
+    _HAS_JINJA2 = True
+    _jinja_env = jinja2.Environment(autoescape=False, cache_size=400)
+except ImportError:
+    jinja2 = None
+    _HAS_JINJA2 = False
+    _jinja_env = None
+
+# Set once the missing-Jinja2 fallback has been reported
+_jinja2_fallback_warned = False
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_jinja2_template(source: str) -> "jinja2.Template":
+    """Compile template source once; repeated renders reuse the result."""
+    return _jinja_env.from_string(source)
+
+
+# File suffix -> content type, resolved with a single dict lookup
+_EXT_TO_TYPE = {
+    **{ext: "yaml" for ext in YAML_EXTENSIONS},
+    **{ext: "json" for ext in JSON_EXTENSIONS},
+    **{ext: "template" for ext in TEMPLATE_EXTENSIONS},
+}
+
+_MERGEABLE_TYPES = frozenset(("yaml", "json"))
+
+_SIMPLE_TEMPLATE_RE = re.compile(r"\{\{\s*([^{}]*?)\s*\}\}")
+
+# Receipt and envelope schema; the tuples fix error-message order and the
+# frozensets give a single set difference for missing-field detection
+_RECEIPT_FIELD_TYPES = {
+    'component_id': str,
+    'installed_at': str,
+    'manifest_hash': str,
+    'files': list,
+}
+_RECEIPT_REQUIRED = frozenset(_RECEIPT_FIELD_TYPES)
+_FILE_ACTION_FIELDS = ('target_path', 'action_type', 'content_hash')
+_FILE_ACTION_REQUIRED = frozenset(_FILE_ACTION_FIELDS)
+_VALID_FILE_ACTIONS = frozenset(('copy', 'template', 'mkdir'))
+_ENVELOPE_FIELDS = ('discovery', 'plan', 'changes', 'validation')
+_ENVELOPE_REQUIRED = frozenset(_ENVELOPE_FIELDS)
+_DISCOVERY_FIELDS = ('path', 'evidence', 'why')
+_DISCOVERY_REQUIRED = frozenset(_DISCOVERY_FIELDS)
+
+
+def _parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC."""
+    if 'Z' in value:
+        value = value.replace('Z', '+00:00')
+    return datetime.fromisoformat(value)
+
+
+_HASHABLE_ITEM_TYPES = (str, int, float, bool, tuple, type(None))
+
+
+def _merge_lists(base: List[Any], overlay: List[Any]) -> List[Any]:
+    """Append overlay items missing from base, in place, preserving order."""
+    if not overlay:
+        return base
+    seen = {item for item in base if isinstance(item, _HASHABLE_ITEM_TYPES)}
+    for item in overlay:
+        if isinstance(item, _HASHABLE_ITEM_TYPES):
+            if item in seen:
+                continue
+            seen.add(item)
+        elif item in base:
+            continue
+        base.append(item)
+    return base
+
 
 class YamlOpsAdapter:
     """Single interface for all content transformation operations."""
@@ -35,15 +149,15 @@ class YamlOpsAdapter:
 
     def merge_yaml(
         self,
-        base_content: str,
-        overlay_content: str,
+        base_content: Union[str, bytes],
+        overlay_content: Union[str, bytes],
         merge_strategy: str = "deep",
     ) -> str:
         """Merge YAML content with specified strategy.
 
         Args:
-            base_content: Base YAML content
-            overlay_content: Overlay YAML content to merge
+            base_content: Base YAML content (str, or UTF-8 bytes)
+            overlay_content: Overlay YAML content to merge (str, or UTF-8 bytes)
             merge_strategy: Merge strategy ('deep', 'shallow', 'replace')
 
         Returns:
@@ -53,18 +167,21 @@ class YamlOpsAdapter:
             TransactionError: If merge operation fails
         """
         try:
-            base_data = yaml.safe_load(base_content) or {}
-            overlay_data = yaml.safe_load(overlay_content) or {}
+            overlay_data = yaml.load(overlay_content, Loader=_SafeLoader) or {}
 
             if merge_strategy == "replace":
+                # Base is discarded, so it is never parsed
                 merged_data = overlay_data
-            elif merge_strategy == "shallow":
-                merged_data = {**base_data, **overlay_data}
-            else:  # deep merge
-                merged_data = self._deep_merge(base_data, overlay_data)
+            else:
+                base_data = yaml.load(base_content, Loader=_SafeLoader) or {}
+                if merge_strategy == "shallow":
+                    merged_data = {**base_data, **overlay_data}
+                else:  # deep merge
+                    merged_data = self._deep_merge(base_data, overlay_data)
 
             return yaml.dump(
                 merged_data,
+                Dumper=_SafeDumper,
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
@@ -85,15 +202,15 @@ class YamlOpsAdapter:
 
     def merge_json(
         self,
-        base_content: str,
-        overlay_content: str,
+        base_content: Union[str, bytes],
+        overlay_content: Union[str, bytes],
         merge_strategy: str = "deep",
     ) -> str:
         """Merge JSON content with specified strategy.
 
         Args:
-            base_content: Base JSON content
-            overlay_content: Overlay JSON content to merge
+            base_content: Base JSON content (str, or UTF-8 bytes)
+            overlay_content: Overlay JSON content to merge (str, or UTF-8 bytes)
             merge_strategy: Merge strategy ('deep', 'shallow', 'replace')
 
         Returns:
@@ -103,17 +220,19 @@ class YamlOpsAdapter:
             TransactionError: If merge operation fails
         """
         try:
-            base_data = json.loads(base_content) if base_content.strip() else {}
-            overlay_data = json.loads(overlay_content) if overlay_content.strip() else {}
+            overlay_data = _json_loads(overlay_content) if overlay_content.strip() else {}
 
             if merge_strategy == "replace":
+                # Base is discarded, so it is never parsed
                 merged_data = overlay_data
-            elif merge_strategy == "shallow":
-                merged_data = {**base_data, **overlay_data}
-            else:  # deep merge
-                merged_data = self._deep_merge(base_data, overlay_data)
+            else:
+                base_data = _json_loads(base_content) if base_content.strip() else {}
+                if merge_strategy == "shallow":
+                    merged_data = {**base_data, **overlay_data}
+                else:  # deep merge
+                    merged_data = self._deep_merge(base_data, overlay_data)
 
-            return json.dumps(merged_data, indent=2, sort_keys=True, ensure_ascii=False)
+            return _json_dumps(merged_data)
 
         except json.JSONDecodeError as e:
             raise TransactionError(
@@ -162,6 +281,28 @@ class YamlOpsAdapter:
                 "process_template",
             ) from e
 
+    def copy_file(self, source_path: Path, target_path: Path) -> None:
+        """Copy a file verbatim without decoding it.
+
+        The copy happens in kernel space (sendfile on Linux), so COPY actions
+        never materialise the content as a Python string.
+
+        Args:
+            source_path: Source file path
+            target_path: Target file path
+
+        Raises:
+            TransactionError: If the copy fails
+        """
+        try:
+            shutil.copy2(source_path, target_path)
+        except Exception as e:
+            raise TransactionError(
+                f"File copy failed for {source_path}: {e}",
+                "yaml_ops",
+                "copy_file",
+            ) from e
+
     def transform_content(
         self,
         source_path: Path,
@@ -184,6 +325,10 @@ class YamlOpsAdapter:
 
         Raises:
             TransactionError: If transformation fails
+
+        Note:
+            Writers should use copy_file() for COPY actions; the COPY branch
+            here decodes the whole file and is only kept for inspection.
         """
         try:
             # Read source content
@@ -210,9 +355,13 @@ class YamlOpsAdapter:
                 source_ext = source_path.suffix.lower()
                 target_ext = target_path.suffix.lower()
 
-                if source_ext in YAML_EXTENSIONS and target_ext in YAML_EXTENSIONS:
+                merge_type = _EXT_TO_TYPE.get(source_ext)
+                if merge_type != _EXT_TO_TYPE.get(target_ext):
+                    merge_type = None
+
+                if merge_type == "yaml":
                     return self.merge_yaml(target_content, source_content, merge_strategy)
-                elif source_ext in JSON_EXTENSIONS and target_ext in JSON_EXTENSIONS:
+                elif merge_type == "json":
                     return self.merge_json(target_content, source_content, merge_strategy)
                 else:
                     # Fall back to simple replacement for other file types
@@ -241,7 +390,7 @@ class YamlOpsAdapter:
         errors = []
 
         try:
-            yaml.safe_load(content)
+            yaml.load(content, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             errors.append(f"Invalid YAML: {e}")
         except Exception as e:
@@ -261,7 +410,7 @@ class YamlOpsAdapter:
         errors = []
 
         try:
-            json.loads(content)
+            _json_loads(content)
         except json.JSONDecodeError as e:
             errors.append(f"Invalid JSON: {e}")
         except Exception as e:
@@ -269,11 +418,13 @@ class YamlOpsAdapter:
 
         return errors
 
-    def extract_variables(self, content: str, extract_format: str = "yaml") -> Dict[str, Any]:
+    def extract_variables(
+        self, content: Union[str, bytes], extract_format: str = "yaml"
+    ) -> Dict[str, Any]:
         """Extract variables from content for template processing.
 
         Args:
-            content: Content to extract variables from
+            content: Content to extract variables from (str, or UTF-8 bytes)
             extract_format: Format of content ('yaml', 'json', 'env')
 
         Returns:
@@ -284,10 +435,12 @@ class YamlOpsAdapter:
         """
         try:
             if extract_format == "yaml":
-                return yaml.safe_load(content) or {}
+                return yaml.load(content, Loader=_SafeLoader) or {}
             elif extract_format == "json":
-                return json.loads(content) if content.strip() else {}
+                return _json_loads(content) if content.strip() else {}
             elif extract_format == "env":
+                if isinstance(content, bytes):
+                    content = content.decode("utf-8")
                 return self._parse_env_format(content)
             else:
                 raise ValueError(f"Unknown extract format: {extract_format}")
@@ -300,48 +453,64 @@ class YamlOpsAdapter:
             ) from e
 
     def _deep_merge(self, base: Any, overlay: Any) -> Any:
-        """Recursively merge two data structures."""
-        if isinstance(base, dict) and isinstance(overlay, dict):
-            result = base.copy()
-            for key, value in overlay.items():
-                if key in result:
-                    result[key] = self._deep_merge(result[key], value)
-                else:
-                    result[key] = value
-            return result
-        elif isinstance(base, list) and isinstance(overlay, list):
-            # For lists, append unique items
-            result = base.copy()
-            for item in overlay:
-                if item not in result:
-                    result.append(item)
-            return result
-        else:
+        """Merge overlay into base, mutating base in place.
+
+        Callers pass freshly parsed data, so base is never shared and does
+        not need to be copied. Values taken from overlay are adopted as-is.
+        """
+        if isinstance(base, list) and isinstance(overlay, list):
+            return _merge_lists(base, overlay)
+        if not (isinstance(base, dict) and isinstance(overlay, dict)):
             # For scalars, overlay wins
             return overlay
+        if not overlay:
+            return base
+        if not base:
+            return overlay
+
+        stack = [(base, overlay)]
+        while stack:
+            base_node, overlay_node = stack.pop()
+            for key, value in overlay_node.items():
+                if key not in base_node:
+                    base_node[key] = value
+                    continue
+
+                current = base_node[key]
+                if isinstance(current, dict) and isinstance(value, dict):
+                    if not current:
+                        base_node[key] = value
+                    elif value:
+                        stack.append((current, value))
+                elif isinstance(current, list) and isinstance(value, list):
+                    _merge_lists(current, value)
+                else:
+                    base_node[key] = value
+
+        return base
 
     def _process_simple_template(self, content: str, variables: Dict[str, Any]) -> str:
         """Process template using simple variable substitution."""
-        result = content
 
-        # Replace {{variable}} patterns
-        for key, value in variables.items():
-            pattern = r'\{\{\s*' + re.escape(key) + r'\s*\}\}'
-            result = re.sub(pattern, str(value), result)
+        # Replace {{variable}} patterns in a single scan; unknown names are kept
+        def substitute(match: "re.Match[str]") -> str:
+            key = match.group(1)
+            return str(variables[key]) if key in variables else match.group(0)
 
-        return result
+        return _SIMPLE_TEMPLATE_RE.sub(substitute, content)
 
     def _process_jinja2_template(self, content: str, variables: Dict[str, Any]) -> str:
         """Process template using Jinja2 (if available)."""
-        try:
-            import jinja2
+        global _jinja2_fallback_warned
 
-            template = jinja2.Template(content)
-            return template.render(**variables)
-
-        except ImportError:
-            logger.warning("Jinja2 not available, falling back to simple template processing")
+        if not _HAS_JINJA2:
+            if not _jinja2_fallback_warned:
+                _jinja2_fallback_warned = True
+                logger.warning("Jinja2 not available, falling back to simple template processing")
             return self._process_simple_template(content, variables)
+
+        try:
+            return _compile_jinja2_template(content).render(**variables)
         except Exception as e:
             raise TransactionError(
                 f"Jinja2 template processing failed: {e}",
@@ -358,11 +527,9 @@ class YamlOpsAdapter:
             if not line or line.startswith('#'):
                 continue
 
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip().strip('"\'')  # Remove quotes
-                variables[key] = value
+            key, sep, value = line.partition('=')
+            if sep:
+                variables[key.strip()] = value.strip().strip('"\'')  # Remove quotes
 
         return variables
 
@@ -375,16 +542,7 @@ class YamlOpsAdapter:
         Returns:
             Content type ('yaml', 'json', 'template', 'text')
         """
-        suffix = file_path.suffix.lower()
-
-        if suffix in YAML_EXTENSIONS:
-            return "yaml"
-        elif suffix in JSON_EXTENSIONS:
-            return "json"
-        elif suffix in TEMPLATE_EXTENSIONS:
-            return "template"
-        else:
-            return "text"
+        return _EXT_TO_TYPE.get(file_path.suffix.lower(), "text")
 
     def is_mergeable(self, source_path: Path, target_path: Path) -> bool:
         """Check if two files can be merged.
@@ -396,12 +554,11 @@ class YamlOpsAdapter:
         Returns:
             True if files can be merged, False otherwise
         """
-        source_type = self.get_content_type(source_path)
-        target_type = self.get_content_type(target_path)
+        source_type = _EXT_TO_TYPE.get(source_path.suffix.lower())
 
         # Both must be the same mergeable type
-        return (source_type == target_type and
-                source_type in ("yaml", "json"))
+        return (source_type in _MERGEABLE_TYPES and
+                source_type == _EXT_TO_TYPE.get(target_path.suffix.lower()))
 
     def validate_receipt_format(self, receipt_data: Dict[str, Any]) -> List[str]:
         """Validate receipt format and return errors.
@@ -412,18 +569,123 @@ class YamlOpsAdapter:
         Returns:
             List of validation errors (empty if valid)
         """
+        errors = self._validate_receipt_fields(receipt_data)
+
+        # Validate files array
+        file_actions = receipt_data.get('files')
+        if isinstance(file_actions, list):
+            for i, file_action in enumerate(file_actions):
+                self._validate_file_action(i, file_action, errors)
+
+        self._validate_receipt_metadata(receipt_data, errors)
+
+        return errors
+
+    def validate_receipt_format_bytes(self, raw: bytes) -> List[str]:
+        """Validate a serialized JSON receipt and return errors.
+
+        When ijson is installed the receipt is streamed: each files[i] entry
+        is built, validated and discarded in turn, so memory stays bounded
+        for receipts with thousands of file actions. Otherwise the receipt
+        is parsed in full and passed to validate_receipt_format.
+
+        Args:
+            raw: Receipt JSON as UTF-8 bytes
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        if not _HAS_IJSON:
+            try:
+                receipt_data = _json_loads(raw)
+            except ValueError as e:
+                return [f"Invalid JSON: {e}"]
+            if not isinstance(receipt_data, dict):
+                return ["Receipt must be a JSON object"]
+            return self.validate_receipt_format(receipt_data)
+
+        try:
+            receipt_data, file_errors = self._stream_receipt(raw)
+        except ijson.JSONError as e:
+            return [f"Invalid JSON: {e}"]
+        if receipt_data is None:
+            return ["Receipt must be a JSON object"]
+
+        errors = self._validate_receipt_fields(receipt_data)
+        errors.extend(file_errors)
+        self._validate_receipt_metadata(receipt_data, errors)
+        return errors
+
+    def _stream_receipt(self, raw: bytes) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """Stream-parse a receipt, validating file actions as they complete.
+
+        Returns the top-level fields (with 'files' left as an empty list when
+        it is an array) and the file action errors, or (None, []) when the
+        document is not a JSON object.
+        """
+        receipt_data: Dict[str, Any] = {}
+        file_errors: List[str] = []
+        file_index = 0
+        key = None
+        depth = 0  # 0: outside receipt, 1: receipt object, 2: files array
+        builder = None
+        builder_depth = 0
+
+        for _, event, value in ijson.parse(io.BytesIO(raw), use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    builder_depth += 1
+                elif event in ('end_map', 'end_array'):
+                    builder_depth -= 1
+                if builder_depth == 0:
+                    if depth == 2:
+                        self._validate_file_action(file_index, builder.value, file_errors)
+                        file_index += 1
+                    else:
+                        receipt_data[key] = builder.value
+                    builder = None
+                continue
+
+            if depth == 0:
+                if event != 'start_map':
+                    return None, []
+                depth = 1
+            elif depth == 1:
+                if event == 'map_key':
+                    key = value
+                elif event == 'end_map':
+                    depth = 0
+                elif key == 'files' and event == 'start_array':
+                    receipt_data['files'] = []
+                    depth = 2
+                elif event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    builder_depth = 1
+                else:
+                    receipt_data[key] = value
+            else:  # inside the files array
+                if event == 'end_array':
+                    depth = 1
+                elif event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    builder_depth = 1
+                else:
+                    self._validate_file_action(file_index, value, file_errors)
+                    file_index += 1
+
+        return receipt_data, file_errors
+
+    def _validate_receipt_fields(self, receipt_data: Dict[str, Any]) -> List[str]:
+        """Validate the top-level receipt fields other than file actions."""
         errors = []
 
         # Required fields
-        required_fields = {
-            'component_id': str,
-            'installed_at': str,
-            'manifest_hash': str,
-            'files': list
-        }
-
-        for field, field_type in required_fields.items():
-            if field not in receipt_data:
+        missing = _RECEIPT_REQUIRED - receipt_data.keys()
+        for field, field_type in _RECEIPT_FIELD_TYPES.items():
+            if field in missing:
                 errors.append(f"Missing required field: {field}")
             elif not isinstance(receipt_data[field], field_type):
                 errors.append(f"Field '{field}' must be of type {field_type.__name__}")
@@ -438,43 +700,51 @@ class YamlOpsAdapter:
             manifest_hash = receipt_data['manifest_hash']
             if not isinstance(manifest_hash, str) or len(manifest_hash) != 64:
                 errors.append("manifest_hash must be 64-character SHA256 hex string")
-            elif not all(c in '0123456789abcdef' for c in manifest_hash.lower()):
-                errors.append("manifest_hash contains invalid characters")
+            else:
+                # fromhex skips whitespace, so also require all 32 bytes decoded
+                try:
+                    valid_hex = len(bytes.fromhex(manifest_hash)) == 32
+                except ValueError:
+                    valid_hex = False
+                if not valid_hex:
+                    errors.append("manifest_hash contains invalid characters")
 
         # Validate installed_at timestamp format
         if 'installed_at' in receipt_data:
             try:
-                from datetime import datetime
-                datetime.fromisoformat(receipt_data['installed_at'].replace('Z', '+00:00'))
+                _parse_iso_timestamp(receipt_data['installed_at'])
             except ValueError:
                 errors.append("installed_at must be valid ISO timestamp")
 
-        # Validate files array
-        if 'files' in receipt_data and isinstance(receipt_data['files'], list):
-            for i, file_action in enumerate(receipt_data['files']):
-                if not isinstance(file_action, dict):
-                    errors.append(f"files[{i}] must be an object")
-                    continue
+        return errors
 
-                # Check required file action fields
-                required_file_fields = ['target_path', 'action_type', 'content_hash']
-                for field in required_file_fields:
-                    if field not in file_action:
-                        errors.append(f"files[{i}] missing required field: {field}")
+    def _validate_file_action(self, index: int, file_action: Any, errors: List[str]) -> None:
+        """Validate a single files[index] entry, appending to errors."""
+        if not isinstance(file_action, dict):
+            errors.append(f"files[{index}] must be an object")
+            return
+
+        # Check required file action fields
+        missing = _FILE_ACTION_REQUIRED - file_action.keys()
+        if missing:
+            errors.extend(
+                f"files[{index}] missing required field: {field}"
+                for field in _FILE_ACTION_FIELDS
+                if field in missing
+            )
 
-                # Validate action_type
-                if 'action_type' in file_action:
-                    valid_actions = {'copy', 'template', 'mkdir'}
-                    if file_action['action_type'] not in valid_actions:
-                        errors.append(f"files[{i}] invalid action_type: {file_action['action_type']}")
+        # Validate action_type (only looked up when present)
+        if 'action_type' not in missing:
+            action_type = file_action['action_type']
+            if action_type not in _VALID_FILE_ACTIONS:
+                errors.append(f"files[{index}] invalid action_type: {action_type}")
 
-        # Validate metadata if present
+    def _validate_receipt_metadata(self, receipt_data: Dict[str, Any], errors: List[str]) -> None:
+        """Validate the optional metadata field, appending to errors."""
         if 'metadata' in receipt_data and receipt_data['metadata'] is not None:
             if not isinstance(receipt_data['metadata'], dict):
                 errors.append("metadata must be an object or null")
 
-        return errors
-
     def render_template(self, template_path: str, variables: Dict[str, Any]) -> str:
         """Render template file with variables (adapter interface for backwards compatibility).
 
@@ -520,51 +790,52 @@ class YamlOpsAdapter:
             TransactionError: If merge operation fails
         """
         try:
-            # Load base configuration
+            base_type = None
             if base_config_path.exists():
-                base_content = base_config_path.read_text(encoding="utf-8")
                 base_type = self.get_content_type(base_config_path)
 
-                if base_type == "yaml":
-                    merged_data = yaml.safe_load(base_content) or {}
-                elif base_type == "json":
-                    merged_data = json.loads(base_content) if base_content.strip() else {}
-                else:
+                if base_type not in _MERGEABLE_TYPES:
                     raise ValueError(f"Unsupported base config format: {base_type}")
-            else:
-                merged_data = {}
-
-            # Apply overlay configurations
-            for overlay_path in overlay_configs:
-                if not overlay_path.exists():
-                    logger.warning(f"Overlay config not found: {overlay_path}")
-                    continue
 
-                overlay_content = overlay_path.read_text(encoding="utf-8")
-                overlay_type = self.get_content_type(overlay_path)
+            if merge_strategy == "replace":
+                # Only the last usable overlay survives, so parse just that one
+                # (or the base when there is none); the result is never mutated
+                merged_data = None
+                for overlay_path in reversed(overlay_configs):
+                    overlay_type = self._overlay_type(overlay_path)
+                    if overlay_type is not None:
+                        merged_data = self._load_config(overlay_path, overlay_type, private=False)
+                        break
+
+                if merged_data is None:
+                    merged_data = (
+                        self._load_config(base_config_path, base_type, private=False)
+                        if base_type else {}
+                    )
+            else:
+                # Load base configuration
+                merged_data = self._load_config(base_config_path, base_type) if base_type else {}
 
-                if overlay_type == "yaml":
-                    overlay_data = yaml.safe_load(overlay_content) or {}
-                elif overlay_type == "json":
-                    overlay_data = json.loads(overlay_content) if overlay_content.strip() else {}
-                else:
-                    logger.warning(f"Unsupported overlay format: {overlay_type} for {overlay_path}")
-                    continue
+                # Apply overlay configurations
+                for overlay_path in overlay_configs:
+                    overlay_type = self._overlay_type(overlay_path)
+                    if overlay_type is None:
+                        continue
+                    overlay_data = self._load_config(overlay_path, overlay_type)
 
-                # Merge overlay into result
-                if merge_strategy == "replace":
-                    merged_data = overlay_data
-                elif merge_strategy == "shallow":
-                    merged_data = {**merged_data, **overlay_data}
-                else:  # deep merge
-                    merged_data = self._deep_merge(merged_data, overlay_data)
+                    # Merge overlay into result
+                    if merge_strategy == "shallow":
+                        merged_data = {**merged_data, **overlay_data}
+                    else:  # deep merge
+                        merged_data = self._deep_merge(merged_data, overlay_data)
 
             # Format output
             if output_format == "json":
-                return json.dumps(merged_data, indent=2, sort_keys=True, ensure_ascii=False)
+                return _json_dumps(merged_data)
             else:  # yaml
                 return yaml.dump(
                     merged_data,
+                    Dumper=_SafeDumper,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
@@ -577,64 +848,46 @@ class YamlOpsAdapter:
                 "merge_configuration",
             ) from e
 
-    def validate_envelope_format(self, envelope_data: Dict[str, Any]) -> List[str]:
-        """Validate Copilot envelope format and return errors.
+    def _overlay_type(self, overlay_path: Path) -> Optional[str]:
+        """Return the content type of a usable overlay, or None to skip it."""
+        if not overlay_path.exists():
+            logger.warning(f"Overlay config not found: {overlay_path}")
+            return None
 
-        Args:
-            envelope_data: Envelope data dictionary to validate
+        overlay_type = self.get_content_type(overlay_path)
 
-        Returns:
-            List of validation errors (empty if valid)
-        """
-        errors = []
+        if overlay_type not in _MERGEABLE_TYPES:
+            logger.warning(f"Unsupported overlay format: {overlay_type} for {overlay_path}")
+            return None
+        return overlay_type
 
-        # Required envelope fields
-        required_fields = ['discovery', 'plan', 'changes', 'validation']
+    def _load_config(self, config_path: Path, content_type: str, private: bool = True) -> Any:
+        """Load a parsed configuration file, reusing earlier parses.
 
-        for field in required_fields:
-            if field not in envelope_data:
-                errors.append(f"Missing required envelope field: {field}")
-
-        # Validate discovery section
-        if 'discovery' in envelope_data:
-            discovery = envelope_data['discovery']
-            if not isinstance(discovery, list):
-                errors.append("discovery must be an array")
-            else:
-                for i, item in enumerate(discovery):
-                    if not isinstance(item, dict):
-                        errors.append(f"discovery[{i}] must be an object")
-                        continue
-                    for req_field in ['path', 'evidence', 'why']:
-                        if req_field not in item:
-                            errors.append(f"discovery[{i}] missing field: {req_field}")
-
-        # Validate plan section
-        if 'plan' in envelope_data:
-            plan = envelope_data['plan']
-            if not isinstance(plan, list):
-                errors.append("plan must be an array")
-
-        # Validate changes section
-        if 'changes' in envelope_data:
-            changes = envelope_data['changes']
-            if not isinstance(changes, list):
-                errors.append("changes must be an array")
-            else:
-                for i, change in enumerate(changes):
-                    if not isinstance(change, dict):
-                        errors.append(f"changes[{i}] must be an object")
-                        continue
-                    if 'path' not in change:
-                        errors.append(f"changes[{i}] missing required field: path")
-
-        # Validate validation section
-        if 'validation' in envelope_data:
-            validation = envelope_data['validation']
-            if not isinstance(validation, dict):
-                errors.append("validation must be an object")
+        With private=True (the default) a deep copy is returned so callers may
+        merge into it freely; otherwise the shared cached value is returned
+        and must not be mutated.
+        """
+        stat = config_path.stat()
+        parsed = self._load_parsed(
+            str(config_path), stat.st_mtime_ns, stat.st_size, content_type
+        )
+        return copy.deepcopy(parsed) if private else parsed
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _load_parsed(path: str, mtime_ns: int, size: int, content_type: str) -> Any:
+        """Read and parse a configuration file.
+
+        Cached on (path, mtime_ns, size) so an edited file is re-parsed. The
+        result is shared between calls and must not be mutated.
+        """
+        raw = Path(path).read_bytes()
+        if content_type == "yaml":
+            return yaml.load(raw, Loader=_SafeLoader) or {}
+        return _json_loads(raw) if raw.strip() else {}
 
-        return errors
+    def validate_envelope_format(self, envelope_data: Dict[str, Any]) -> List[str]:
         """Validate Copilot envelope format and return errors.
 
         Args:
@@ -646,11 +899,13 @@ class YamlOpsAdapter:
         errors = []
 
         # Required envelope fields
-        required_fields = ['discovery', 'plan', 'changes', 'validation']
-
-        for field in required_fields:
-            if field not in envelope_data:
-                errors.append(f"Missing required envelope field: {field}")
+        missing = _ENVELOPE_REQUIRED - envelope_data.keys()
+        if missing:
+            errors.extend(
+                f"Missing required envelope field: {field}"
+                for field in _ENVELOPE_FIELDS
+                if field in missing
+            )
 
         # Validate discovery section
         if 'discovery' in envelope_data:
@@ -662,9 +917,13 @@ class YamlOpsAdapter:
                     if not isinstance(item, dict):
                         errors.append(f"discovery[{i}] must be an object")
                         continue
-                    for req_field in ['path', 'evidence', 'why']:
-                        if req_field not in item:
-                            errors.append(f"discovery[{i}] missing field: {req_field}")
+                    missing = _DISCOVERY_REQUIRED - item.keys()
+                    if missing:
+                        errors.extend(
+                            f"discovery[{i}] missing field: {req_field}"
+                            for req_field in _DISCOVERY_FIELDS
+                            if req_field in missing
+                        )
 
         # Validate plan section
         if 'plan' in envelope_data:
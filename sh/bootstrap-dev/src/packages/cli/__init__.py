@@ -5,11 +5,22 @@ bootstrap system, coordinating between the resolver, planner, and installer
 components to provide a cohesive user experience.
 """
 
-from .main import main
-from .args import parse_args, BootstrapArgs
+from .._lazy import lazy_exports
 
 __all__ = [
     "main",
     "parse_args",
     "BootstrapArgs",
 ]
+
+# Exported name -> submodule. Resolved on first access so that importing a
+# sibling module (e.g. cli.enhanced_commands for plugin --help) does not
+# load main and, through it, the whole orchestrator stack.
+_EXPORTS = {
+    "main": ".main",
+    "parse_args": ".args",
+    "BootstrapArgs": ".args",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -4,16 +4,29 @@ This module defines the CLI interface and parses user arguments into
 structured configuration objects for use by the orchestrator.
 """
 
-import argparse
+import functools
+import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, NoReturn, Optional, Tuple
 
-from ..domain.constants import DEFAULT_PROFILE
+if TYPE_CHECKING:
+    import argparse
 
 
-@dataclass
+def _default_profile() -> str:
+    """Resolve the default profile lazily to keep the domain package off the import path."""
+    from ..domain.constants import DEFAULT_PROFILE
+
+    return DEFAULT_PROFILE
+
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class BootstrapArgs:
     """Parsed command-line arguments."""
 
@@ -23,13 +36,14 @@ class BootstrapArgs:
     # Target and source configuration
     target_dir: Path
     manifest_path: Optional[Path] = None
-    profile: str = DEFAULT_PROFILE
-    components: List[str] = None
+    profile: str = field(default_factory=_default_profile)
+    components: List[str] = field(default_factory=list)
 
     # Operation modes
     dry_run: bool = False
     force: bool = False
     repair: bool = False
+    keep_going: bool = False
 
     # List command flags (renamed to avoid conflicts)
     list_profiles: bool = False
@@ -46,28 +60,16 @@ class BootstrapArgs:
     output_format: str = "text"  # text, json, yaml
     no_color: bool = False
 
-    def __post_init__(self):
-        """Validate and normalize arguments."""
-        if self.components is None:
-            self.components = []
 
-        # Convert string paths to Path objects
-        if isinstance(self.target_dir, str):
-            self.target_dir = Path(self.target_dir)
-        if isinstance(self.manifest_path, str):
-            self.manifest_path = Path(self.manifest_path)
-        if isinstance(self.log_file, str):
-            self.log_file = Path(self.log_file)
+def _split_components(value: str) -> List[str]:
+    """Split a comma-separated --components value, ignoring empty entries."""
+    return [name for name in value.split(",") if name]
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser."""
+# Help text for the top-level parser and its subcommands
+_DESCRIPTION = "AI Guardrails Bootstrap System - Install and manage AI guardrails for development projects"
 
-    parser = argparse.ArgumentParser(
-        prog="ai-guardrails",
-        description="AI Guardrails Bootstrap System - Install and manage AI guardrails for development projects",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   # Preview installation plan
   ai-guardrails plan --profile full
@@ -89,14 +91,44 @@ Examples:
 
   # Uninstall specific components
   ai-guardrails uninstall --components hooks,workflows
-        """,
+"""
+
+_PLAN_DESCRIPTION = "Generate and display the installation plan showing what files would be installed, modified, or skipped."
+_INSTALL_DESCRIPTION = "Install the specified profile and components to the target directory."
+_DOCTOR_DESCRIPTION = "Validate the current installation and optionally repair detected issues."
+_LIST_DESCRIPTION = "Display available installation profiles, components, and their descriptions."
+_UNINSTALL_DESCRIPTION = "Remove the specified components from the target directory."
+
+
+@functools.lru_cache(maxsize=8)
+def create_parser(active_cmd: Optional[str] = None) -> "argparse.ArgumentParser":
+    """Create the main argument parser.
+
+    Parsers are cached per active_cmd; argparse does not mutate a parser
+    while parsing, so repeated parse_args() calls reuse them. Defaults that
+    depend on process state (the working directory) are resolved by
+    parse_args() instead.
+
+    Args:
+        active_cmd: Subcommand being invoked. Only its subparser is fully
+            defined; None defines all of them.
+    """
+    import argparse
+
+    from ..domain.constants import DEFAULT_PROFILE
+
+    parser = argparse.ArgumentParser(
+        prog="ai-guardrails",
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Global options
     parser.add_argument(
         "--target-dir",
         type=Path,
-        default=Path.cwd(),
+        default=None,
         help="Target directory for installation (default: current directory)",
     )
 
@@ -115,8 +147,8 @@ Examples:
 
     parser.add_argument(
         "--components",
-        nargs="*",
-        help="Specific components to operate on (default: all in profile)",
+        type=_split_components,
+        help="Comma-separated components to operate on (default: all in profile)",
     )
 
     # Operation modes
@@ -181,23 +213,41 @@ Examples:
         required=True,
     )
 
-    # Plan command
+    # Only the invoked subcommand gets its full definition; the others are
+    # registered with their help text so choices and top-level help are intact
+    for name, (help_text, build) in _SUBCOMMANDS.items():
+        if active_cmd is None or name == active_cmd:
+            build(subparsers, help_text)
+        else:
+            subparsers.add_parser(name, help=help_text)
+
+    return parser
+
+
+def _build_plan(subparsers, help_text: str) -> None:
+    """Define the plan subcommand."""
     subparsers.add_parser(
         "plan",
-        help="Show installation plan without making changes",
-        description="Generate and display the installation plan showing what files would be installed, modified, or skipped.",
+        help=help_text,
+        description=_PLAN_DESCRIPTION,
     )
 
-    # Install command
+
+def _build_install(subparsers, help_text: str) -> None:
+    """Define the install subcommand."""
     subparsers.add_parser(
         "install",
-        help="Install AI guardrails components",
-        description="Install the specified profile and components to the target directory.",
-    )    # Doctor command
+        help=help_text,
+        description=_INSTALL_DESCRIPTION,
+    )
+
+
+def _build_doctor(subparsers, help_text: str) -> None:
+    """Define the doctor subcommand."""
     doctor_parser = subparsers.add_parser(
         "doctor",
-        help="Validate and repair installation",
-        description="Validate the current installation and optionally repair detected issues.",
+        help=help_text,
+        description=_DOCTOR_DESCRIPTION,
     )
 
     doctor_parser.add_argument(
@@ -206,45 +256,214 @@ Examples:
         help="Automatically repair detected issues",
     )
 
-    # List command
+
+def _build_list(subparsers, help_text: str) -> None:
+    """Define the list subcommand."""
     list_parser = subparsers.add_parser(
         "list",
-        help="List available profiles and components",
-        description="Display available installation profiles, components, and their descriptions.",
+        help=help_text,
+        description=_LIST_DESCRIPTION,
     )
 
     list_group = list_parser.add_mutually_exclusive_group()
     list_group.add_argument(
         "--profiles",
+        dest="list_profiles",
         action="store_true",
         help="List available profiles",
     )
     list_group.add_argument(
         "--components",
+        dest="list_components",
         action="store_true",
         help="List available components",
     )
     list_group.add_argument(
         "--installed",
+        dest="list_installed",
         action="store_true",
         help="List currently installed components",
     )
 
-    # Uninstall command
+
+def _build_uninstall(subparsers, help_text: str) -> None:
+    """Define the uninstall subcommand."""
     uninstall_parser = subparsers.add_parser(
         "uninstall",
-        help="Remove installed components",
-        description="Remove the specified components from the target directory.",
+        help=help_text,
+        description=_UNINSTALL_DESCRIPTION,
     )
 
     uninstall_parser.add_argument(
         "--components",
-        nargs="+",
+        type=_split_components,
         required=True,
-        help="Components to uninstall",
+        help="Comma-separated components to uninstall",
     )
 
-    return parser
+    uninstall_parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="Continue with the remaining components after a failure",
+    )
+
+
+# Subcommand name -> (help text, builder), in display order
+_SUBCOMMANDS = {
+    "plan": ("Show installation plan without making changes", _build_plan),
+    "install": ("Install AI guardrails components", _build_install),
+    "doctor": ("Validate and repair installation", _build_doctor),
+    "list": ("List available profiles and components", _build_list),
+    "uninstall": ("Remove installed components", _build_uninstall),
+}
+
+# Global value options -> (BootstrapArgs field, converter)
+_FAST_GLOBAL_VALUES = {
+    "--target-dir": ("target_dir", Path),
+    "--manifest": ("manifest_path", Path),
+    "--profile": ("profile", str),
+    "--components": ("components", _split_components),
+    "--log-file": ("log_file", Path),
+    "--output-format": ("output_format", str),
+}
+_FAST_GLOBAL_FLAGS = {
+    "--dry-run": "dry_run",
+    "--force": "force",
+    "-v": "verbose",
+    "--verbose": "verbose",
+    "-q": "quiet",
+    "--quiet": "quiet",
+    "--structured-logs": "structured_logs",
+    "--no-color": "no_color",
+}
+# Option names _find_command skips over, taken from the fast-path tables
+_GLOBAL_VALUE_OPTIONS = frozenset(_FAST_GLOBAL_VALUES)
+_GLOBAL_FLAG_OPTIONS = frozenset(_FAST_GLOBAL_FLAGS)
+
+
+def _find_command(args: List[str]) -> Optional[str]:
+    """Locate the subcommand in args without running argparse.
+
+    Returns None whenever the scan is not certain (help requested,
+    abbreviated or unknown options), so the caller builds every subparser.
+    """
+    i = 0
+    while i < len(args):
+        token = args[i]
+        if token in _SUBCOMMANDS:
+            return token
+        if token in _GLOBAL_VALUE_OPTIONS:
+            i += 2
+        elif token in _GLOBAL_FLAG_OPTIONS or (
+            "=" in token and token.split("=", 1)[0] in _GLOBAL_VALUE_OPTIONS
+        ):
+            i += 1
+        else:
+            return None
+    return None
+
+
+# Subcommand -> flags it accepts, mapped to BootstrapArgs fields
+_FAST_COMMAND_FLAGS = {
+    "plan": {},
+    "install": {},
+    "doctor": {"--repair": "repair"},
+    "list": {
+        "--profiles": "list_profiles",
+        "--components": "list_components",
+        "--installed": "list_installed",
+    },
+    "uninstall": {"--keep-going": "keep_going"},
+}
+_OUTPUT_FORMATS = ("text", "json", "yaml")
+
+# Commands that operate on an existing (or, for install, creatable) target
+_TARGET_REQUIRED_CMDS = frozenset(("install", "doctor"))
+
+
+def _take_value(args: List[str], i: int) -> Optional[Tuple[str, int]]:
+    """Return the value of the option at args[i] and the index after it.
+
+    Accepts both '--opt value' and '--opt=value'; returns None when the
+    value is missing or looks like another option.
+    """
+    _, eq, value = args[i].partition("=")
+    if eq:
+        return value, i + 1
+    if i + 1 >= len(args) or args[i + 1].startswith("-"):
+        return None
+    return args[i + 1], i + 2
+
+
+def _fast_parse(args: List[str]) -> Optional[dict]:
+    """Parse the common invocation shapes without building an argparse parser.
+
+    Returns BootstrapArgs keyword arguments, or None for anything outside
+    the plain grammar (help, abbreviations, combined short flags, errors)
+    so the caller falls back to argparse for its exact behaviour and
+    messages.
+    """
+    result = {}
+    i = 0
+    n = len(args)
+
+    # Global options precede the subcommand
+    while True:
+        if i >= n:
+            return None
+        token = args[i]
+        if token in _FAST_COMMAND_FLAGS:
+            break
+        name = token.partition("=")[0]
+        if name in _FAST_GLOBAL_VALUES:
+            taken = _take_value(args, i)
+            if taken is None:
+                return None
+            value, i = taken
+            if name == "--output-format" and value not in _OUTPUT_FORMATS:
+                return None
+            dest, convert = _FAST_GLOBAL_VALUES[name]
+            result[dest] = convert(value)
+        elif token in _FAST_GLOBAL_FLAGS:
+            result[_FAST_GLOBAL_FLAGS[token]] = True
+            i += 1
+        else:
+            return None
+
+    command = args[i]
+    result["command"] = sys.intern(command)
+
+    flags = _FAST_COMMAND_FLAGS[command]
+    # uninstall requires its own --components; the global one does not count
+    needs_components = command == "uninstall"
+    i += 1
+    while i < n:
+        token = args[i]
+        if token in flags:
+            result[flags[token]] = True
+            i += 1
+        elif command == "uninstall" and token.partition("=")[0] == "--components":
+            taken = _take_value(args, i)
+            if taken is None:
+                return None
+            value, i = taken
+            result["components"] = _split_components(value)
+            needs_components = False
+        else:
+            return None
+
+    if needs_components:
+        return None
+    if command == "list" and (
+        result.get("list_profiles", False)
+        + result.get("list_components", False)
+        + result.get("list_installed", False)
+    ) > 1:
+        return None
+
+    if "target_dir" not in result:
+        result["target_dir"] = Path.cwd()
+    return result
 
 
 def parse_args(args: Optional[List[str]] = None) -> BootstrapArgs:
@@ -256,45 +475,48 @@ def parse_args(args: Optional[List[str]] = None) -> BootstrapArgs:
     Returns:
         Parsed arguments as BootstrapArgs object
     """
-    parser = create_parser()
-
     if args is None:
         args = sys.argv[1:]
 
-    parsed = parser.parse_args(args)
-
-    # Convert Namespace to BootstrapArgs
-    # Handle the conflict between global --components and list --components
-    if parsed.command == "list":
-        # For list command, use the boolean flags from the list subcommand
-        list_components_flag = getattr(parsed, "components", False)
-        global_components = []  # List command doesn't use global components
-    else:
-        # For other commands, use the global components list
-        list_components_flag = False
-        global_components = getattr(parsed, "components", None) or []
-    
+    fast = _fast_parse(args)
+    if fast is not None:
+        return BootstrapArgs(**fast)
+
+    parser = create_parser(_find_command(args))
+
+    parsed = vars(parser.parse_args(args))
+
+    # Convert Namespace to BootstrapArgs; the list subcommand flags have
+    # their own dests, so --components is always the component list
     return BootstrapArgs(
-        command=parsed.command,
-        target_dir=parsed.target_dir,
-        manifest_path=getattr(parsed, "manifest_path", None),
-        profile=parsed.profile,
-        components=global_components,
-        dry_run=parsed.dry_run,
-        force=parsed.force,
-        repair=getattr(parsed, "repair", False),
-        list_profiles=getattr(parsed, "profiles", False),
-        list_components=list_components_flag,
-        list_installed=getattr(parsed, "installed", False),
-        verbose=parsed.verbose,
-        quiet=parsed.quiet,
-        structured_logs=parsed.structured_logs,
-        log_file=parsed.log_file,
-        output_format=parsed.output_format,
-        no_color=parsed.no_color,
+        # Interned so comparisons against command literals hit the identity fast path
+        command=sys.intern(parsed["command"]),
+        target_dir=parsed["target_dir"] or Path.cwd(),
+        manifest_path=parsed.get("manifest_path"),
+        profile=parsed["profile"],
+        components=parsed["components"] or [],
+        dry_run=parsed["dry_run"],
+        force=parsed["force"],
+        repair=parsed.get("repair", False),
+        keep_going=parsed.get("keep_going", False),
+        list_profiles=parsed.get("list_profiles", False),
+        list_components=parsed.get("list_components", False),
+        list_installed=parsed.get("list_installed", False),
+        verbose=parsed["verbose"],
+        quiet=parsed["quiet"],
+        structured_logs=parsed["structured_logs"],
+        log_file=parsed["log_file"],
+        output_format=parsed["output_format"],
+        no_color=parsed["no_color"],
     )
 
 
+def _die(message: str) -> NoReturn:
+    """Report a validation error on stderr and exit with status 1."""
+    sys.stderr.write(message + "\n")
+    raise SystemExit(1)
+
+
 def validate_args(args: BootstrapArgs) -> None:
     """Validate parsed arguments for consistency.
 
@@ -306,31 +528,26 @@ def validate_args(args: BootstrapArgs) -> None:
     """
     # Check mutually exclusive options
     if args.verbose and args.quiet:
-        print("Error: --verbose and --quiet cannot be used together", file=sys.stderr)
-        sys.exit(1)
+        _die("Error: --verbose and --quiet cannot be used together")
 
     # Validate target directory for install/doctor commands
-    if args.command in ("install", "doctor") and not args.target_dir.exists():
+    if args.command in _TARGET_REQUIRED_CMDS and not os.path.exists(args.target_dir):
         if args.command == "install":
             # Create target directory for install
             try:
                 args.target_dir.mkdir(parents=True, exist_ok=True)
             except Exception as e:
-                print(f"Error: Cannot create target directory {args.target_dir}: {e}", file=sys.stderr)
-                sys.exit(1)
+                _die(f"Error: Cannot create target directory {args.target_dir}: {e}")
         else:
-            print(f"Error: Target directory does not exist: {args.target_dir}", file=sys.stderr)
-            sys.exit(1)
+            _die(f"Error: Target directory does not exist: {args.target_dir}")
 
     # Validate manifest path if provided
-    if args.manifest_path and not args.manifest_path.exists():
-        print(f"Error: Manifest file not found: {args.manifest_path}", file=sys.stderr)
-        sys.exit(1)
+    if args.manifest_path and not os.path.isfile(args.manifest_path):
+        _die(f"Error: Manifest file not found: {args.manifest_path}")
 
     # Validate log file directory
-    if args.log_file:
+    if args.log_file and not os.path.isdir(args.log_file.parent):
         try:
             args.log_file.parent.mkdir(parents=True, exist_ok=True)
         except Exception as e:
-            print(f"Error: Cannot create log directory {args.log_file.parent}: {e}", file=sys.stderr)
-            sys.exit(1)
+            _die(f"Error: Cannot create log directory {args.log_file.parent}: {e}")
@@ -20,37 +20,208 @@ Commands:
 """
 
 import click
-import yaml
-import json
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from string import Template
+from typing import NamedTuple
 import logging
 
-# Fallback for tabulate if not available
-try:
-    from tabulate import tabulate
-except ImportError:
+from ..utils import Colors
 
-    def tabulate(data, headers=None, tablefmt="grid"):
-        """Simple fallback for tabulate."""
-        if not data:
-            return ""
+# Status labels are fixed strings, so color them once at import time
+_OK = Colors.ok("[SUCCESS]")
+_ERR = Colors.error("[ERROR]")
+_VALID = Colors.ok("[VALID]")
+_INVALID = Colors.error("[INVALID]")
 
-        if headers:
-            result = " | ".join(headers) + "\n"
-            result += "-" * len(result) + "\n"
-        else:
-            result = ""
+# yaml, json, tabulate and the plugin registry stack are imported where they
+# are used so that --help and unrelated commands do not pay for them
+_tabulate = None
 
-        for row in data:
-            result += " | ".join(str(cell) for cell in row) + "\n"
 
-        return result
+def _simple_tabulate(data, headers=None, tablefmt="grid"):
+    """Simple fallback for tabulate."""
+    if not data:
+        return ""
 
+    if headers:
+        result = " | ".join(headers) + "\n"
+        result += "-" * len(result) + "\n"
+    else:
+        result = ""
+
+    for row in data:
+        result += " | ".join(str(cell) for cell in row) + "\n"
+
+    return result
+
+
+def tabulate(data, headers=None, tablefmt="grid"):
+    """Render a table with tabulate, falling back if it is not installed."""
+    global _tabulate
+    if _tabulate is None:
+        try:
+            from tabulate import tabulate as impl
+        except ImportError:
+            impl = _simple_tabulate
+        _tabulate = impl
+    return _tabulate(data, headers=headers, tablefmt=tablefmt)
+
+
+def _json_dumps(obj):
+    """Serialize obj as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(obj, indent=2)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _yaml_load(stream):
+    """Safe-load YAML, using the libyaml-backed loader when it is available."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _yaml_dump(data, stream=None):
+    """Dump data as block-style YAML, using the libyaml-backed dumper when available."""
+    import yaml
+
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+    )
+
+
+def _truncate(text, limit):
+    """Shorten text to limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+# Subdirectories scaffolded by the create command
+_PLUGIN_SUBDIRS = ("components", "templates", "hooks", "docs")
+
+_README_TEMPLATE = Template("""# ${name} Plugin
+
+${description}
+
+## Installation
+
+```bash
+ai-guardrails plugin install ${name}
+```
+
+## Usage
+
+Describe how to use your plugin here.
+
+## Configuration
+
+Describe any configuration options here.
+
+## Components
+
+- `${name}-component`: Main component for ${name}
+
+## License
+
+${license}
+""")
+
+
+class _PluginRow(NamedTuple):
+    """One plugin in the output of the list command."""
+
+    name: str
+    version: str
+    description: str
+    author: str
+    source: str
+
+
+def _as_data(records):
+    """Return records in serializable form, turning NamedTuple rows into dicts."""
+    if isinstance(records, dict):
+        return records
+    return [r._asdict() if isinstance(r, tuple) else r for r in records]
+
+
+def _render_json(records, columns):
+    return _json_dumps(_as_data(records))
+
+
+def _render_yaml(records, columns):
+    return _yaml_dump(_as_data(records))
 
-from ..core.plugin_registry import PluginRegistry, PluginSource
-from ..core.plugin_validator import PluginValidator
-from ..domain.plugin_models import PluginManifest
-from ..utils import Colors
+
+def _render_table(records, columns):
+    headers = [header for header, _ in columns]
+    rows = (tuple(cell(record) for _, cell in columns) for record in records)
+    return tabulate(rows, headers=headers, tablefmt="grid")
+
+
+# --format value -> renderer(records, columns); columns are (header, getter)
+# pairs and only apply to tables
+_RENDERERS = {
+    "json": _render_json,
+    "yaml": _render_yaml,
+    "table": _render_table,
+}
+
+
+def _write_rendered(output_format, records, columns):
+    """Render records and write the whole block to stdout in one call.
+
+    Rendered output can be large (every plugin in a registry), so it skips
+    click.echo's per-call style stripping and encoding checks; renderers
+    never emit ANSI codes.
+    """
+    out = click.get_text_stream("stdout")
+    out.write(_RENDERERS[output_format](records, columns) + "\n")
+    out.flush()
+
+
+_SEARCH_COLUMNS = (
+    ("Name", itemgetter("name")),
+    ("Version", itemgetter("version")),
+    ("Description", lambda r: _truncate(r["description"], 50)),
+    ("Author", itemgetter("author")),
+    ("Downloads", itemgetter("downloads")),
+)
+_LIST_COLUMNS = (
+    ("Name", attrgetter("name")),
+    ("Version", attrgetter("version")),
+    ("Description", lambda p: _truncate(p.description, 40)),
+    ("Author", attrgetter("author")),
+    ("Source", attrgetter("source")),
+)
+_SOURCE_COLUMNS = (
+    ("Name", itemgetter("name")),
+    ("Type", itemgetter("type")),
+    ("URL", lambda r: _truncate(r["url"], 50)),
+    ("Enabled", lambda r: "Yes" if r["enabled"] else "No"),
+    ("Priority", itemgetter("priority")),
+)
+
+
+def _print_traceback_if_verbose(ctx):
+    """Print the traceback of the exception being handled when --verbose is set."""
+    if ctx.obj.get("verbose"):
+        import traceback
+
+        traceback.print_exc()
+
+
+def _get_registry(registry_dir):
+    """Create a PluginRegistry, importing the registry stack on first use."""
+    from ..core.plugin_registry import PluginRegistry
+
+    return PluginRegistry(registry_dir)
 
 
 @click.group()
@@ -84,7 +255,7 @@ def plugin(ctx, verbose, registry_dir):
 def search(ctx, query, tags, author, limit, output_format):
     """Search for plugins in the registry."""
     try:
-        registry = PluginRegistry(ctx.obj.get("registry_dir"))
+        registry = _get_registry(ctx.obj.get("registry_dir"))
 
         # Update index if needed
         if ctx.obj.get("verbose"):
@@ -94,7 +265,8 @@ def search(ctx, query, tags, author, limit, output_format):
         # Search plugins
         results = registry.search_plugins(
             query=query or "",
-            tags=list(tags) if tags else None,
+            # 'list' is the list command in this module, not the builtin
+            tags=[*tags] if tags else None,
             author=author,
             limit=limit,
         )
@@ -103,62 +275,22 @@ def search(ctx, query, tags, author, limit, output_format):
             click.echo("No plugins found matching criteria.")
             return
 
-        # Format output
-        if output_format == "json":
-            plugin_data = []
-            for plugin in results:
-                plugin_data.append(
-                    {
-                        "name": plugin.name,
-                        "version": plugin.version,
-                        "description": plugin.description,
-                        "author": plugin.author,
-                        "tags": plugin.tags,
-                        "downloads": plugin.download_count,
-                    }
-                )
-            click.echo(json.dumps(plugin_data, indent=2))
-
-        elif output_format == "yaml":
-            plugin_data = []
-            for plugin in results:
-                plugin_data.append(
-                    {
-                        "name": plugin.name,
-                        "version": plugin.version,
-                        "description": plugin.description,
-                        "author": plugin.author,
-                        "tags": plugin.tags,
-                        "downloads": plugin.download_count,
-                    }
-                )
-            click.echo(yaml.dump(plugin_data, default_flow_style=False))
-
-        else:  # table format
-            headers = ["Name", "Version", "Description", "Author", "Downloads"]
-            rows = []
-
-            for plugin in results:
-                rows.append(
-                    [
-                        plugin.name,
-                        plugin.version,
-                        plugin.description[:50] + "..."
-                        if len(plugin.description) > 50
-                        else plugin.description,
-                        plugin.author,
-                        plugin.download_count,
-                    ]
-                )
-
-            click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
+        plugin_data = [
+            {
+                "name": plugin.name,
+                "version": plugin.version,
+                "description": plugin.description,
+                "author": plugin.author,
+                "tags": plugin.tags,
+                "downloads": plugin.download_count,
+            }
+            for plugin in results
+        ]
+        _write_rendered(output_format, plugin_data, _SEARCH_COLUMNS)
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Failed to search plugins: {e}")
-        if ctx.obj.get("verbose"):
-            import traceback
-
-            traceback.print_exc()
+        click.echo(f"{_ERR} Failed to search plugins: {e}")
+        _print_traceback_if_verbose(ctx)
 
 
 @plugin.command()
@@ -173,7 +305,7 @@ def search(ctx, query, tags, author, limit, output_format):
 def install(ctx, plugin_name, version, target, components, config, dry_run, force):
     """Install a plugin with enhanced features."""
     try:
-        registry = PluginRegistry(ctx.obj.get("registry_dir"))
+        registry = _get_registry(ctx.obj.get("registry_dir"))
         target_path = Path(target) if target else Path.cwd()
 
         if dry_run:
@@ -185,35 +317,40 @@ def install(ctx, plugin_name, version, target, components, config, dry_run, forc
             click.echo(f"Target: {target_path}")
 
         # Load configuration if provided
+        plugin_config = None
         if config:
             config_path = Path(config)
-            if config_path.exists():
+            try:
                 with open(config_path) as f:
                     if config_path.suffix in [".yaml", ".yml"]:
-                        yaml.safe_load(f)
+                        plugin_config = _yaml_load(f)
                     else:
-                        json.load(f)
+                        import json
+
+                        plugin_config = json.load(f)
+            except FileNotFoundError:
+                pass
 
         # Install plugin
         success = registry.install_plugin(
-            plugin_name=plugin_name, version=version, target_dir=target_path
+            plugin_name=plugin_name,
+            version=version,
+            target_dir=target_path,
+            configuration=plugin_config,
         )
 
         if success:
             click.echo(
-                f"{Colors.success('[SUCCESS]')} Plugin {plugin_name} installed successfully"
+                f"{_OK} Plugin {plugin_name} installed successfully"
             )
         else:
             click.echo(
-                f"{Colors.error('[ERROR]')} Failed to install plugin {plugin_name}"
+                f"{_ERR} Failed to install plugin {plugin_name}"
             )
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Installation failed: {e}")
-        if ctx.obj.get("verbose"):
-            import traceback
-
-            traceback.print_exc()
+        click.echo(f"{_ERR} Installation failed: {e}")
+        _print_traceback_if_verbose(ctx)
 
 
 @plugin.command()
@@ -230,10 +367,10 @@ def uninstall(ctx, plugin_name, purge):
             click.echo("Purging all plugin data...")
 
         # Placeholder for actual uninstall logic
-        click.echo(f"{Colors.success('[SUCCESS]')} Plugin {plugin_name} uninstalled")
+        click.echo(f"{_OK} Plugin {plugin_name} uninstalled")
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Uninstall failed: {e}")
+        click.echo(f"{_ERR} Uninstall failed: {e}")
 
 
 @plugin.command()
@@ -248,7 +385,7 @@ def uninstall(ctx, plugin_name, purge):
 def list(ctx, output_format, installed_only):
     """List available or installed plugins."""
     try:
-        registry = PluginRegistry(ctx.obj.get("registry_dir"))
+        registry = _get_registry(ctx.obj.get("registry_dir"))
 
         if installed_only:
             # List installed plugins (placeholder)
@@ -258,48 +395,30 @@ def list(ctx, output_format, installed_only):
             registry.update_index()
             plugins = []
 
-            for name, versions in registry.index.plugins.items():
+            for versions in registry.index.plugins.values():
                 if versions:
-                    latest = max(versions, key=lambda v: v.version)
+                    latest = versions[0]
+                    for candidate in versions:
+                        if candidate.version > latest.version:
+                            latest = candidate
                     plugins.append(
-                        {
-                            "name": latest.name,
-                            "version": latest.version,
-                            "description": latest.description,
-                            "author": latest.author,
-                            "source": latest.source.name
-                            if latest.source
-                            else "unknown",
-                        }
+                        _PluginRow(
+                            latest.name,
+                            latest.version,
+                            latest.description,
+                            latest.author,
+                            latest.source.name if latest.source else "unknown",
+                        )
                     )
 
         if not plugins:
             click.echo("No plugins found.")
             return
 
-        # Format output
-        if output_format == "json":
-            click.echo(json.dumps(plugins, indent=2))
-        elif output_format == "yaml":
-            click.echo(yaml.dump(plugins, default_flow_style=False))
-        else:  # table
-            headers = ["Name", "Version", "Description", "Author", "Source"]
-            rows = [
-                [
-                    p["name"],
-                    p["version"],
-                    p["description"][:40] + "..."
-                    if len(p["description"]) > 40
-                    else p["description"],
-                    p["author"],
-                    p["source"],
-                ]
-                for p in plugins
-            ]
-            click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
+        _write_rendered(output_format, plugins, _LIST_COLUMNS)
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Failed to list plugins: {e}")
+        click.echo(f"{_ERR} Failed to list plugins: {e}")
 
 
 @plugin.command()
@@ -312,7 +431,7 @@ def list(ctx, output_format, installed_only):
 def info(ctx, plugin_name, version, output_format):
     """Show detailed information about a plugin."""
     try:
-        registry = PluginRegistry(ctx.obj.get("registry_dir"))
+        registry = _get_registry(ctx.obj.get("registry_dir"))
 
         plugin_meta = registry.get_plugin_info(plugin_name, version)
         if not plugin_meta:
@@ -339,13 +458,10 @@ def info(ctx, plugin_name, version, output_format):
             else None,
         }
 
-        if output_format == "json":
-            click.echo(json.dumps(plugin_info, indent=2))
-        else:
-            click.echo(yaml.dump(plugin_info, default_flow_style=False))
+        _write_rendered(output_format, plugin_info, None)
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Failed to get plugin info: {e}")
+        click.echo(f"{_ERR} Failed to get plugin info: {e}")
 
 
 @plugin.command()
@@ -355,12 +471,15 @@ def info(ctx, plugin_name, version, output_format):
 def validate(ctx, manifest_path, strict):
     """Validate a plugin manifest file."""
     try:
+        from ..core.plugin_validator import PluginValidator
+        from ..domain.plugin_models import PluginManifest
+
         validator = PluginValidator()
         manifest_file = Path(manifest_path)
 
         # Load manifest
         with open(manifest_file) as f:
-            manifest_data = yaml.safe_load(f)
+            manifest_data = _yaml_load(f)
 
         # Convert to PluginManifest object
         manifest = PluginManifest.from_dict(manifest_data)
@@ -369,16 +488,16 @@ def validate(ctx, manifest_path, strict):
         errors = validator.validate_plugin_manifest(manifest)
 
         if not errors:
-            click.echo(f"{Colors.success('[VALID]')} Plugin manifest is valid")
+            click.echo(f"{_VALID} Plugin manifest is valid")
         else:
-            click.echo(f"{Colors.error('[INVALID]')} Plugin manifest has errors:")
+            click.echo(f"{_INVALID} Plugin manifest has errors:")
             for error in errors:
                 click.echo(f"  - {error}")
 
         return len(errors) == 0
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Validation failed: {e}")
+        click.echo(f"{_ERR} Validation failed: {e}")
         return False
 
 
@@ -394,24 +513,24 @@ def create(ctx, plugin_name, template, author, description, license):
     try:
         plugin_dir = Path(f"plugins/{plugin_name}")
 
-        if plugin_dir.exists():
+        # Create plugin directory structure
+        try:
+            plugin_dir.mkdir(parents=True)
+        except FileExistsError:
             click.echo(
-                f"{Colors.error('[ERROR]')} Plugin directory already exists: {plugin_dir}"
+                f"{_ERR} Plugin directory already exists: {plugin_dir}"
             )
             return
+        for subdir in _PLUGIN_SUBDIRS:
+            (plugin_dir / subdir).mkdir()
 
-        # Create plugin directory structure
-        plugin_dir.mkdir(parents=True)
-        (plugin_dir / "components").mkdir()
-        (plugin_dir / "templates").mkdir()
-        (plugin_dir / "hooks").mkdir()
-        (plugin_dir / "docs").mkdir()
+        description = description or f"A plugin for {plugin_name}"
 
         # Create plugin manifest
         manifest = {
             "name": plugin_name,
             "version": "0.1.0",
-            "description": description or f"A plugin for {plugin_name}",
+            "description": description,
             "author": author or "Unknown",
             "license": license,
             "components": {
@@ -428,45 +547,20 @@ def create(ctx, plugin_name, template, author, description, license):
             },
         }
 
-        with open(plugin_dir / "plugin-manifest.yaml", "w") as f:
-            yaml.dump(manifest, f, default_flow_style=False)
+        (plugin_dir / "plugin-manifest.yaml").write_text(_yaml_dump(manifest))
 
         # Create README
-        readme_content = f"""# {plugin_name} Plugin
-
-{description or f"A plugin for {plugin_name}"}
-
-## Installation
-
-```bash
-ai-guardrails plugin install {plugin_name}
-```
-
-## Usage
-
-Describe how to use your plugin here.
-
-## Configuration
-
-Describe any configuration options here.
-
-## Components
-
-- `{plugin_name}-component`: Main component for {plugin_name}
-
-## License
-
-{license}
-"""
-
-        with open(plugin_dir / "README.md", "w") as f:
-            f.write(readme_content)
+        (plugin_dir / "README.md").write_text(
+            _README_TEMPLATE.substitute(
+                name=plugin_name, description=description, license=license
+            )
+        )
 
-        click.echo(f"{Colors.success('[SUCCESS]')} Created plugin: {plugin_dir}")
+        click.echo(f"{_OK} Created plugin: {plugin_dir}")
         click.echo(f"Edit {plugin_dir}/plugin-manifest.yaml to customize your plugin")
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Failed to create plugin: {e}")
+        click.echo(f"{_ERR} Failed to create plugin: {e}")
 
 
 @click.group()
@@ -493,7 +587,9 @@ def registry(ctx):
 def add(ctx, name, url, source_type, priority, auth_token):
     """Add a plugin source to the registry."""
     try:
-        registry_obj = PluginRegistry(ctx.parent.obj.get("registry_dir"))
+        registry_obj = _get_registry(ctx.parent.obj.get("registry_dir"))
+
+        from ..core.plugin_registry import PluginSource
 
         source = PluginSource(
             name=name,
@@ -504,12 +600,12 @@ def add(ctx, name, url, source_type, priority, auth_token):
         )
 
         if registry_obj.add_source(source):
-            click.echo(f"{Colors.success('[SUCCESS]')} Added plugin source: {name}")
+            click.echo(f"{_OK} Added plugin source: {name}")
         else:
-            click.echo(f"{Colors.error('[ERROR]')} Failed to add plugin source: {name}")
+            click.echo(f"{_ERR} Failed to add plugin source: {name}")
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Failed to add source: {e}")
+        click.echo(f"{_ERR} Failed to add source: {e}")
 
 
 @registry.command()
@@ -518,17 +614,17 @@ def add(ctx, name, url, source_type, priority, auth_token):
 def remove(ctx, name):
     """Remove a plugin source from the registry."""
     try:
-        registry_obj = PluginRegistry(ctx.parent.obj.get("registry_dir"))
+        registry_obj = _get_registry(ctx.parent.obj.get("registry_dir"))
 
         if registry_obj.remove_source(name):
-            click.echo(f"{Colors.success('[SUCCESS]')} Removed plugin source: {name}")
+            click.echo(f"{_OK} Removed plugin source: {name}")
         else:
             click.echo(
-                f"{Colors.error('[ERROR]')} Failed to remove plugin source: {name}"
+                f"{_ERR} Failed to remove plugin source: {name}"
             )
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Failed to remove source: {e}")
+        click.echo(f"{_ERR} Failed to remove source: {e}")
 
 
 @registry.command()
@@ -537,20 +633,20 @@ def remove(ctx, name):
 def sync(ctx, force):
     """Synchronize with plugin registries."""
     try:
-        registry_obj = PluginRegistry(ctx.parent.obj.get("registry_dir"))
+        registry_obj = _get_registry(ctx.parent.obj.get("registry_dir"))
 
         click.echo("Synchronizing with plugin registries...")
         success = registry_obj.update_index(force=force)
 
         if success:
             click.echo(
-                f"{Colors.success('[SUCCESS]')} Registry synchronization complete"
+                f"{_OK} Registry synchronization complete"
             )
         else:
-            click.echo(f"{Colors.error('[ERROR]')} Registry synchronization failed")
+            click.echo(f"{_ERR} Registry synchronization failed")
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Sync failed: {e}")
+        click.echo(f"{_ERR} Sync failed: {e}")
 
 
 @registry.command()
@@ -564,7 +660,7 @@ def sync(ctx, force):
 def sources(ctx, output_format):
     """List configured plugin sources."""
     try:
-        registry_obj = PluginRegistry(ctx.parent.obj.get("registry_dir"))
+        registry_obj = _get_registry(ctx.parent.obj.get("registry_dir"))
 
         sources = registry_obj.index.sources
 
@@ -572,53 +668,20 @@ def sources(ctx, output_format):
             click.echo("No plugin sources configured.")
             return
 
-        if output_format == "json":
-            source_data = []
-            for source in sources:
-                source_data.append(
-                    {
-                        "name": source.name,
-                        "url": source.url,
-                        "type": source.type,
-                        "enabled": source.enabled,
-                        "priority": source.priority,
-                    }
-                )
-            click.echo(json.dumps(source_data, indent=2))
-
-        elif output_format == "yaml":
-            source_data = []
-            for source in sources:
-                source_data.append(
-                    {
-                        "name": source.name,
-                        "url": source.url,
-                        "type": source.type,
-                        "enabled": source.enabled,
-                        "priority": source.priority,
-                    }
-                )
-            click.echo(yaml.dump(source_data, default_flow_style=False))
-
-        else:  # table
-            headers = ["Name", "Type", "URL", "Enabled", "Priority"]
-            rows = []
-
-            for source in sources:
-                rows.append(
-                    [
-                        source.name,
-                        source.type,
-                        source.url[:50] + "..." if len(source.url) > 50 else source.url,
-                        "Yes" if source.enabled else "No",
-                        source.priority,
-                    ]
-                )
-
-            click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
+        source_data = [
+            {
+                "name": source.name,
+                "url": source.url,
+                "type": source.type,
+                "enabled": source.enabled,
+                "priority": source.priority,
+            }
+            for source in sources
+        ]
+        _write_rendered(output_format, source_data, _SOURCE_COLUMNS)
 
     except Exception as e:
-        click.echo(f"{Colors.error('[ERROR]')} Failed to list sources: {e}")
+        click.echo(f"{_ERR} Failed to list sources: {e}")
 
 
 # Add registry commands to plugin group
@@ -4,14 +4,31 @@ This module provides the main() function that coordinates argument parsing,
 logging configuration, and command execution through the orchestrator.
 """
 
+import logging
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from .args import parse_args, validate_args
 from ..adapters.logging import configure_logging, get_logger
-from ..core.orchestrator import Orchestrator
 from ..domain.errors import BootstrapError, ConflictError, DepError, DriftError, ValidationError, InstallationError
 
+if TYPE_CHECKING:
+    from ..core.orchestrator import Orchestrator
+
+logger = get_logger(__name__)
+
+# ANSI escapes for plan output, read-only and shared by every render
+_COLORS_ON = MappingProxyType({
+    "reset": "\033[0m",
+    "green": "\033[32m",
+    "yellow": "\033[33m",
+    "red": "\033[31m",
+    "blue": "\033[34m",
+})
+_COLORS_OFF = MappingProxyType(dict.fromkeys(_COLORS_ON, ""))
+
 
 def main() -> int:
     """Main entry point for the CLI.
@@ -33,10 +50,12 @@ def main() -> int:
             quiet=args.quiet,
         )
 
-        logger = get_logger(__name__)
         logger.debug(f"Starting {args.command} command with args: {args}")
 
-        # Create and run orchestrator
+        # Create and run orchestrator; imported here so that help and
+        # argument errors do not load the resolver/planner/installer stack
+        from ..core.orchestrator import Orchestrator
+
         orchestrator = Orchestrator(target_dir=args.target_dir)
 
         # Execute command
@@ -50,14 +69,13 @@ def main() -> int:
             return 1
 
     except BootstrapError as e:
-        logger = get_logger(__name__)
         logger.error(f"Bootstrap error: {e}")
 
         # Display enhanced error information
         display_enhanced_error(e, args)
 
         # Print structured error info if verbose
-        if hasattr(args, "verbose") and args.verbose and hasattr(e, 'details') and e.details:
+        if args.verbose and e.details:
             logger.debug(f"Error details: {e.details}")
 
         return 1
@@ -67,7 +85,6 @@ def main() -> int:
         return 130  # Standard exit code for SIGINT
 
     except Exception as e:
-        logger = get_logger(__name__)
         logger.error(f"Unexpected error: {e}", exc_info=True)
         return 1
 
@@ -82,22 +99,13 @@ def execute_command(orchestrator: "Orchestrator", args) -> bool:
     Returns:
         True if command succeeded, False otherwise
     """
-    logger = get_logger(__name__)
+    handler = _COMMANDS.get(args.command)
+    if handler is None:
+        logger.error(f"Unknown command: {args.command}")
+        return False
 
     try:
-        if args.command == "plan":
-            return execute_plan(orchestrator, args)
-        elif args.command == "install":
-            return execute_install(orchestrator, args)
-        elif args.command == "doctor":
-            return execute_doctor(orchestrator, args)
-        elif args.command == "list":
-            return execute_list(orchestrator, args)
-        elif args.command == "uninstall":
-            return execute_uninstall(orchestrator, args)
-        else:
-            logger.error(f"Unknown command: {args.command}")
-            return False
+        return handler(orchestrator, args)
 
     except BootstrapError:
         # Re-raise bootstrap errors to be handled at top level
@@ -117,7 +125,6 @@ def execute_plan(orchestrator: "Orchestrator", args) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    logger = get_logger(__name__)
     logger.info("Generating installation plan...")
 
     plan = orchestrator.plan(
@@ -148,8 +155,6 @@ def execute_install(orchestrator: "Orchestrator", args) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    logger = get_logger(__name__)
-
     if args.dry_run:
         logger.info("Performing dry run installation...")
         return execute_plan(orchestrator, args)
@@ -158,8 +163,6 @@ def execute_install(orchestrator: "Orchestrator", args) -> bool:
 
         results = orchestrator.install(
             profile=args.profile,
-            template_repo=getattr(args, 'template_repo', None),
-            plugins_dir=getattr(args, 'plugins_dir', None),
             dry_run=args.dry_run,
             force=args.force,
         )
@@ -169,9 +172,9 @@ def execute_install(orchestrator: "Orchestrator", args) -> bool:
 
         if success:
             logger.info("Installation completed successfully")
-        else:
+        elif logger.isEnabledFor(logging.ERROR):
             failed_components = [comp for comp, result in results.items() if not result]
-            logger.error(f"Installation failed for components: {', '.join(failed_components)}")
+            logger.error("Installation failed for components: %s", ", ".join(failed_components))
 
         return success
 
@@ -186,35 +189,36 @@ def execute_doctor(orchestrator: "Orchestrator", args) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    logger = get_logger(__name__)
     logger.info("Running diagnostic checks...")
 
     diagnostics = orchestrator.doctor(
-        components=getattr(args, 'components', None),
+        components=args.components,
         repair=args.repair,
-        dry_run=getattr(args, 'dry_run', False),
+        dry_run=args.dry_run,
     )
 
     if not diagnostics:
         logger.info("✅ No issues detected")
         return True
 
-    # Display diagnostics
+    # Display diagnostics, tallying errors and repairable issues in the same pass
     logger.warning(f"Found {len(diagnostics)} issues:")
+    has_errors = False
+    repairable_count = 0
+    lines = []
     for diagnostic in diagnostics:
-        print(f"  {diagnostic}")
-
-    # Check if any errors were found
-    has_errors = any(d.severity == "error" for d in diagnostics)
+        lines.append(f"  {diagnostic}\n")
+        has_errors |= diagnostic.severity == "error"
+        repairable_count += bool(diagnostic.repairable)
+    sys.stdout.write("".join(lines))
 
     if args.repair:
         # Repair was already attempted in the orchestrator.doctor() call
-        repairable_count = sum(1 for d in diagnostics if d.repairable)
         if repairable_count > 0:
             logger.info(f"Repair attempted for {repairable_count} issues")
         return not has_errors  # Success if no errors remain
     else:
-        if any(d.repairable for d in diagnostics):
+        if repairable_count:
             logger.info("Use --repair to automatically fix repairable issues")
         return not has_errors  # Success if no errors found
 
@@ -229,51 +233,63 @@ def execute_list(orchestrator: "Orchestrator", args) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    if args.list_profiles or not any([args.list_components, args.list_installed]):
-        # List profiles (default)
-        profiles = orchestrator.list_profiles()
-        print("Available profiles:")
-        for profile in profiles:
-            print(f"  {profile}")
-
+    # The list flags are mutually exclusive; profiles is the default
+    if args.list_installed:
+        _list_installed(orchestrator)
     elif args.list_components:
-        # List components with rich formatting
-        try:
-            # Get the base manifest (without plugins merged)
-            base_manifest = orchestrator.resolver._load_manifest()
-            
-            # Create plugin system and component manager for rich display
-            from ..managers.plugin_system import PluginSystem
-            from ..presentation.presenters import ComponentPresenter
-            
-            plugin_system = PluginSystem(orchestrator.target_dir)
-            
-            # Get the merged manifest from plugin system for complete component list
-            merged_manifest = plugin_system.get_merged_manifest(base_manifest)
-            
-            # Use the rich component listing which knows how to separate plugin components
-            ComponentPresenter.list_all_components(merged_manifest, plugin_system)
-            
-        except Exception as e:
-            # Fallback to simple listing if rich formatting fails
-            components = orchestrator.list_components()
-            print("Available components:")
-            for component in components:
-                print(f"  {component}")
-
-    elif args.list_installed:
-        # List installed components
-        installed = orchestrator.list_installed()
-        if installed:
-            print("Installed components:")
-            for component in installed:
-                print(f"  {component}")
-        else:
-            print("No components installed")
+        _list_components(orchestrator)
+    else:
+        _list_profiles(orchestrator)
 
     return True
 
 
+def _list_profiles(orchestrator: "Orchestrator") -> None:
+    """Print the available profiles."""
+    profiles = orchestrator.list_profiles()
+    print("Available profiles:")
+    for profile in profiles:
+        print(f"  {profile}")
+
+
+def _list_components(orchestrator: "Orchestrator") -> None:
+    """Print the available components, grouped by source when possible."""
+    try:
+        # Get the base manifest (without plugins merged)
+        base_manifest = orchestrator.resolver._load_manifest()
+
+        # Create plugin system and component manager for rich display
+        from ..managers.plugin_system import PluginSystem
+        from ..presentation.presenters import ComponentPresenter
+
+        plugin_system = PluginSystem(orchestrator.target_dir)
+
+        # Get the merged manifest from plugin system for complete component list
+        merged_manifest = plugin_system.get_merged_manifest(base_manifest)
+
+        # Use the rich component listing which knows how to separate plugin components
+        ComponentPresenter.list_all_components(merged_manifest, plugin_system)
+
+    except Exception as e:
+        # Fallback to simple listing if rich formatting fails
+        logger.debug("Rich component listing failed: %s", e)
+        components = orchestrator.list_components()
+        print("Available components:")
+        for component in components:
+            print(f"  {component}")
+
+
+def _list_installed(orchestrator: "Orchestrator") -> None:
+    """Print the installed components."""
+    installed = orchestrator.list_installed()
+    if installed:
+        print("Installed components:")
+        for component in installed:
+            print(f"  {component}")
+    else:
+        print("No components installed")
+
+
 def execute_uninstall(orchestrator: "Orchestrator", args) -> bool:
     """Execute the uninstall command.
 
@@ -284,16 +300,21 @@ def execute_uninstall(orchestrator: "Orchestrator", args) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    logger = get_logger(__name__)
-    logger.info(f"Uninstalling components: {', '.join(args.components)}")
-
-    # Uninstall each component individually
-    results = []
-    for component in args.components:
-        result = orchestrator.uninstall(component)
-        results.append(result)
-
-    success = all(results)
+    logger.info("Uninstalling components: %s", ", ".join(args.components))
+
+    # Uninstall each component individually, stopping at the first failure
+    # unless --keep-going was given
+    success = True
+    for index, component in enumerate(args.components, 1):
+        if orchestrator.uninstall(component):
+            continue
+        success = False
+        if not args.keep_going and index < len(args.components):
+            logger.error(
+                "Stopping after %s failed; use --keep-going to uninstall the remaining components",
+                component,
+            )
+            break
 
     if success:
         logger.info("Uninstallation completed successfully")
@@ -303,6 +324,16 @@ def execute_uninstall(orchestrator: "Orchestrator", args) -> bool:
     return success
 
 
+# Command name -> handler, consulted by execute_command
+_COMMANDS = {
+    "plan": execute_plan,
+    "install": execute_install,
+    "doctor": execute_doctor,
+    "list": execute_list,
+    "uninstall": execute_uninstall,
+}
+
+
 def display_plan_text(plan, args) -> None:
     """Display installation plan in human-readable text format.
 
@@ -310,26 +341,40 @@ def display_plan_text(plan, args) -> None:
         plan: InstallPlan object
         args: Command arguments for formatting options
     """
-    # Colors (if not disabled)
-    if getattr(args, 'no_color', False):
-        colors = {"reset": "", "green": "", "yellow": "", "red": "", "blue": ""}
-    else:
-        colors = {
-            "reset": "\033[0m",
-            "green": "\033[32m",
-            "yellow": "\033[33m",
-            "red": "\033[31m",
-            "blue": "\033[34m",
-        }
-
-    print(f"\n{colors['blue']}Installation Plan{colors['reset']}")
+    colors = _COLORS_OFF if args.no_color else _COLORS_ON
+
+    # Color-code by action type; SKIP (and anything unknown) is uncolored
+    blue, reset = colors["blue"], colors["reset"]
+    kind_color = {"COPY": colors["green"], "MERGE": colors["yellow"], "TEMPLATE": blue, "SKIP": reset}
+    # Padded, colored action labels are built once per action type; only
+    # action types outside the table are added on first sight
+    labels = {kind: f"    {color}{kind:8}{reset} " for kind, color in kind_color.items()}
+    component_prefix = f"{blue}Component: "
+
+    # Build the per-component details and the summary counts in one pass;
+    # the details are written after the header and structure, in one write
+    total_files = 0
+    actionable_files = 0
+    details = []
+    for component_plan in plan.components:
+        file_actions = component_plan.file_actions
+        total_files += len(file_actions)
+        details.append(f"{component_prefix}{component_plan.component_id}{reset}\n")
+        details.append(f"  Files: {len(file_actions)}\n")
+        for action in file_actions:
+            kind = action.action_type
+            if kind != "SKIP":
+                actionable_files += 1
+            label = labels.get(kind)
+            if label is None:
+                label = labels[kind] = f"    {reset}{kind:8}{reset} "
+            details.append(f"{label}{action.source_path} → {action.target_path} ({action.reason})\n")
+        details.append("\n")
+
+    print(f"\n{blue}Installation Plan{reset}")
     print("=" * 50)
     print(f"Profile: {plan.profile}")
     print(f"Components: {len(plan.components)}")
-
-    total_files = sum(len(comp.file_actions) for comp in plan.components)
-    actionable_files = sum(1 for comp in plan.components for action in comp.file_actions if action.action_type != "SKIP")
-
     print(f"Total files: {total_files}")
     print(f"Actionable files: {actionable_files}")
     print()
@@ -338,24 +383,7 @@ def display_plan_text(plan, args) -> None:
     display_target_structure(plan, colors)
     print()
 
-    for component_plan in plan.components:
-        print(f"{colors['blue']}Component: {component_plan.component_id}{colors['reset']}")
-        print(f"  Files: {len(component_plan.file_actions)}")
-
-        for action in component_plan.file_actions:
-            # Color-code by action type
-            if action.action_type == "COPY":
-                color = colors["green"]
-            elif action.action_type == "MERGE":
-                color = colors["yellow"]
-            elif action.action_type == "TEMPLATE":
-                color = colors["blue"]
-            else:  # SKIP
-                color = colors["reset"]
-
-            print(f"    {color}{action.action_type:8}{colors['reset']} {action.source_path} → {action.target_path} ({action.reason})")
-
-        print()
+    sys.stdout.write("".join(details))
 
 
 def display_target_structure(plan, colors) -> None:
@@ -430,6 +458,40 @@ def _print_tree_recursive(tree: dict, prefix: str, is_last: bool, colors: dict)
             _print_tree_recursive(subtree, next_prefix, is_last_item, colors)
 
 
+def _format_tips(*tips: str) -> str:
+    return "\n💡 Resolution suggestions:\n" + "".join(f"  • {tip}\n" for tip in tips)
+
+
+# Error type -> preformatted resolution suggestions
+_RESOLUTION_TIPS = {
+    ConflictError: _format_tips(
+        "Use --force to override existing files",
+        "Check for conflicting component dependencies",
+        "Review your profile configuration",
+    ),
+    DepError: _format_tips(
+        "Check component dependencies in manifest files",
+        "Verify all required plugins are available",
+        "Use 'ai-guardrails list --components' to see available components",
+    ),
+    DriftError: _format_tips(
+        "Use 'ai-guardrails doctor' to diagnose drift issues",
+        "Use 'ai-guardrails doctor --repair' to fix drift automatically",
+        "Use --force to ignore drift and proceed",
+    ),
+    ValidationError: _format_tips(
+        "Check your installation manifest syntax",
+        "Verify plugin manifest files are valid",
+        "Use --verbose for detailed validation messages",
+    ),
+    InstallationError: _format_tips(
+        "Check available disk space",
+        "Verify write permissions in target directory",
+        "Use --dry-run to preview changes first",
+    ),
+}
+
+
 def display_enhanced_error(error: BootstrapError, args) -> None:
     """Display enhanced error messages with resolution suggestions.
 
@@ -439,40 +501,16 @@ def display_enhanced_error(error: BootstrapError, args) -> None:
     """
     print(f"\n❌ Error: {error}")
 
-    # Provide context-specific help
-    if isinstance(error, ConflictError):
-        print("\n💡 Resolution suggestions:")
-        print("  • Use --force to override existing files")
-        print("  • Check for conflicting component dependencies")
-        print("  • Review your profile configuration")
-
-    elif isinstance(error, DepError):
-        print("\n💡 Resolution suggestions:")
-        print("  • Check component dependencies in manifest files")
-        print("  • Verify all required plugins are available")
-        print("  • Use 'ai-guardrails list --components' to see available components")
-
-    elif isinstance(error, DriftError):
-        print("\n💡 Resolution suggestions:")
-        print("  • Use 'ai-guardrails doctor' to diagnose drift issues")
-        print("  • Use 'ai-guardrails doctor --repair' to fix drift automatically")
-        print("  • Use --force to ignore drift and proceed")
-
-    elif isinstance(error, ValidationError):
-        print("\n💡 Resolution suggestions:")
-        print("  • Check your installation manifest syntax")
-        print("  • Verify plugin manifest files are valid")
-        print("  • Use --verbose for detailed validation messages")
-
-    elif isinstance(error, InstallationError):
-        print("\n💡 Resolution suggestions:")
-        print("  • Check available disk space")
-        print("  • Verify write permissions in target directory")
-        print("  • Use --dry-run to preview changes first")
+    # Provide context-specific help for the most specific known error type
+    for error_type in type(error).__mro__:
+        tips = _RESOLUTION_TIPS.get(error_type)
+        if tips:
+            sys.stdout.write(tips)
+            break
 
     # Always show how to get more help
     print("\n🔍 For more details, run with --verbose")
-    if not getattr(args, 'verbose', False):
+    if not args.verbose:
         print("💬 For troubleshooting help, see the documentation or run 'ai-guardrails doctor'")
 
 
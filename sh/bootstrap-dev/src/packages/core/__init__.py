@@ -9,12 +9,7 @@ Contains the main orchestration components for the new architecture:
 - Doctor: State validation and repair system
 """
 
-from .bootstrap import InfrastructureBootstrap  # Legacy support
-from .orchestrator import Orchestrator
-from .resolver import Resolver, ResolvedSpec
-from .planner import Planner
-from .installer import Installer
-from .doctor import Doctor, DoctorDiagnostic
+from .._lazy import lazy_exports
 
 __all__ = [
     # New architecture
@@ -28,3 +23,20 @@ __all__ = [
     # Legacy support
     'InfrastructureBootstrap',
 ]
+
+# Exported name -> submodule. Resolved on first access so that importing
+# core.orchestrator does not also load the legacy InfrastructureBootstrap
+# and its manager stack.
+_EXPORTS = {
+    'Orchestrator': '.orchestrator',
+    'Resolver': '.resolver',
+    'ResolvedSpec': '.resolver',
+    'Planner': '.planner',
+    'Installer': '.installer',
+    'Doctor': '.doctor',
+    'DoctorDiagnostic': '.doctor',
+    'InfrastructureBootstrap': '.bootstrap',
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
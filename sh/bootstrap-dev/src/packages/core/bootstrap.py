@@ -10,15 +10,85 @@ The InfrastructureBootstrap class follows a composition pattern, delegating
 specific responsibilities to focused manager classes while maintaining a clean
 public API for end users.
 """
-import yaml
+import hashlib
+import json
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from ..utils import Colors
-from ..managers import StateManager, PluginSystem, ComponentManager, ConfigManager
-from ..operations import Doctor
-from ..presentation import ProfilePresenter
-from .target_structure_manager import TargetStructureManager
+
+
+# Tool installation layout: <root>/src/{ai-guardrails-templates,plugins,...}
+_SRC_DIR = Path(__file__).parents[3] / "src"
+_TEMPLATE_REPO = _SRC_DIR / "ai-guardrails-templates"
+_MANIFEST_PATH = _SRC_DIR / "installation-manifest.yaml"
+_PLUGINS_DIR = _SRC_DIR / "plugins"
+
+
+def _manifest_cache_file(manifest_path: Path) -> Optional[Path]:
+    """Cache file for a manifest, unique per absolute manifest path.
+
+    Resolved per call so a missing home directory only disables the cache.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    digest = hashlib.sha1(str(manifest_path.resolve()).encode()).hexdigest()[:16]
+    return Path(cache_home) / "ai-guardrails" / f"manifest-{digest}.json"
+
+
+def _read_cached_manifest(cache_file: Path, key: Tuple[int, int]) -> Optional[Dict]:
+    """Return the cached manifest if it was built from the same file version"""
+    try:
+        with open(cache_file, "rb") as f:
+            cached = json.load(f)
+        cached_key, data = cached["key"], cached["manifest"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    return data if cached_key == list(key) else None
+
+
+def _write_cached_manifest(cache_file: Path, key: Tuple[int, int], data: Dict) -> None:
+    """Atomically store a parsed manifest; the cache is best effort"""
+    try:
+        payload = json.dumps({"key": list(key), "manifest": data})
+    except (TypeError, ValueError):
+        return
+    # Dates or non-string keys would not survive the round trip; skip those
+    if json.loads(payload)["manifest"] != data:
+        return
+
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(payload, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+# Top-level files that mark an existing Python or Node.js project
+_PROJECT_MARKERS = frozenset(("pyproject.toml", "setup.py", "package.json"))
+
+
+@lru_cache(maxsize=8)
+def _detect_profile_for(target_dir: Path, mtime_ns: int) -> str:
+    """Pick a profile from one directory listing; cached per directory version"""
+    try:
+        entries = os.listdir(target_dir)
+    except OSError:
+        return "minimal"
+
+    # Existing projects get the standard profile, new ones start minimal
+    return "standard" if _PROJECT_MARKERS.intersection(entries) else "minimal"
 
 
 class InfrastructureBootstrap:
@@ -26,39 +96,96 @@ class InfrastructureBootstrap:
         """Initialize the bootstrap system"""
         self.target_dir = Path(target_dir) if target_dir else Path.cwd()
 
-        # Templates should come from the tool installation, not the target project
-        script_dir = Path(__file__).parent.parent.parent.parent / "bin"
-        self.template_repo = script_dir.parent / "src" / "ai-guardrails-templates"
-
-        # Manifest should also come from tool installation
-        self.manifest_path = script_dir.parent / "src" / "installation-manifest.yaml"
+        # Templates, manifest and plugins come from the tool installation,
+        # not the target project
+        self.template_repo = _TEMPLATE_REPO
+        self.manifest_path = _MANIFEST_PATH
+        self._plugins_dir = _PLUGINS_DIR
 
         # Load manifest
         self.manifest = self._load_manifest()
 
-        # Initialize managers
-        self.state_manager = StateManager(self.target_dir)
-        self.plugin_system = PluginSystem(self.target_dir)
-        self.component_manager = ComponentManager(self.target_dir, self.template_repo, self.plugin_system)
-        self.config_manager = ConfigManager(self.target_dir)
-        self.doctor_manager = Doctor(self.target_dir, self.state_manager, self.component_manager)
-        
-        # Initialize target structure manager for schema composition
-        plugins_dir = script_dir.parent / "src" / "plugins"
-        self.target_structure_manager = TargetStructureManager(self.target_dir, plugins_dir)
+    # Managers are built on first use, so each operation only pays for the
+    # managers it touches (e.g. schema composition only for structure checks)
+    @cached_property
+    def state_manager(self):
+        from ..managers import StateManager
+
+        return StateManager(self.target_dir)
+
+    @cached_property
+    def plugin_system(self):
+        from ..managers import PluginSystem
+
+        return PluginSystem(self.target_dir)
+
+    @cached_property
+    def component_manager(self):
+        from ..managers import ComponentManager
+
+        return ComponentManager(self.target_dir, self.template_repo, self.plugin_system)
+
+    @cached_property
+    def config_manager(self):
+        from ..managers import ConfigManager
+
+        return ConfigManager(self.target_dir)
+
+    @cached_property
+    def doctor_manager(self):
+        from ..operations import Doctor
+
+        return Doctor(self.target_dir, self.state_manager, self.component_manager)
 
-        # Get merged manifest (including plugins)
-        self.merged_manifest = self.plugin_system.get_merged_manifest(self.manifest)
+    @cached_property
+    def target_structure_manager(self):
+        from .target_structure_manager import TargetStructureManager
+
+        return TargetStructureManager(self.target_dir, self._plugins_dir)
+
+    @cached_property
+    def merged_manifest(self) -> Dict:
+        """Manifest merged with plugin components and profiles"""
+        return self.plugin_system.get_merged_manifest(self.manifest)
+
+    @cached_property
+    def _profile_components(self) -> Dict[str, List[str]]:
+        """Flat profile -> components view used by install_profile and init"""
+        return {
+            name: config.get('components', [])
+            for name, config in self.merged_manifest.get('profiles', {}).items()
+        }
+
+    def _refresh_merged_manifest(self) -> None:
+        """Drop the merged manifest and its lookups; both rebuild on next use"""
+        self.__dict__.pop('merged_manifest', None)
+        self.__dict__.pop('_profile_components', None)
 
     def _load_manifest(self) -> Dict:
         """Load installation manifest from tool installation"""
-        if not self.manifest_path.exists():
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
             print(f"{Colors.warn('[WARN]')} Manifest not found: {self.manifest_path}")
             print(f"{Colors.info('[INFO]')} Creating minimal manifest for bootstrapping")
             return self._create_minimal_manifest()
 
-        with open(self.manifest_path) as f:
-            return yaml.safe_load(f)
+        # Reuse the parsed manifest from the previous run when the file is unchanged
+        key = (stat.st_mtime_ns, stat.st_size)
+        cache_file = _manifest_cache_file(self.manifest_path)
+        if cache_file is not None:
+            manifest = _read_cached_manifest(cache_file, key)
+            if manifest is not None:
+                return manifest
+
+        import yaml
+
+        # Prefer libyaml's C loader; it is much faster on a single bytes buffer
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        manifest = yaml.load(self.manifest_path.read_bytes(), Loader=loader)
+        if cache_file is not None:
+            _write_cached_manifest(cache_file, key, manifest)
+        return manifest
 
     def _create_minimal_manifest(self) -> Dict:
         """Create a minimal manifest for bootstrapping"""
@@ -119,13 +246,12 @@ class InfrastructureBootstrap:
     # Profile management
     def install_profile(self, profile: str, force: bool = False) -> bool:
         """Install a profile"""
-        if profile not in self.merged_manifest['profiles']:
+        components = self._profile_components.get(profile)
+        if components is None:
             raise ValueError(f"Unknown profile: {profile}")
 
-        profile_config = self.merged_manifest['profiles'][profile]
-        components = profile_config['components']
-
-        print(f"Installing profile: {profile} ({profile_config['description']})")
+        description = self.merged_manifest['profiles'][profile]['description']
+        print(f"Installing profile: {profile} ({description})")
 
         success = True
         installed_components = []
@@ -144,6 +270,8 @@ class InfrastructureBootstrap:
 
     def list_all_profiles(self):
         """List all available profiles"""
+        from ..presentation import ProfilePresenter
+
         ProfilePresenter.list_all_profiles(self.merged_manifest)
 
     # Diagnostic functionality
@@ -158,15 +286,12 @@ class InfrastructureBootstrap:
         if profile == 'auto':
             profile = self._detect_project_profile()
 
-        if profile not in self.merged_manifest['profiles']:
-            available_profiles = list(self.merged_manifest['profiles'].keys())
+        components = self._profile_components.get(profile)
+        if components is None:
             print(f"{Colors.error('[ERROR]')} Unknown profile: {profile}")
-            print(f"Available profiles: {', '.join(available_profiles)}")
+            print(f"Available profiles: {', '.join(self._profile_components)}")
             return False
 
-        profile_config = self.merged_manifest['profiles'][profile]
-        components = profile_config['components']
-
         if dry_run:
             print(f"Would install profile '{profile}' with components:")
             for component in components:
@@ -177,16 +302,12 @@ class InfrastructureBootstrap:
 
     def _detect_project_profile(self) -> str:
         """Auto-detect appropriate profile based on project characteristics"""
-        # Check for existing Python project
-        if (self.target_dir / "pyproject.toml").exists() or (self.target_dir / "setup.py").exists():
-            return "standard"
-
-        # Check for Node.js project
-        if (self.target_dir / "package.json").exists():
-            return "standard"
-
-        # Default to minimal for new projects
-        return "minimal"
+        try:
+            mtime_ns = self.target_dir.stat().st_mtime_ns
+        except OSError:
+            return "minimal"
+        # The directory mtime changes whenever an entry is added or removed
+        return _detect_profile_for(self.target_dir, mtime_ns)
 
     # Target Structure Management Methods
     def get_target_structure_schema(self, enabled_plugins: List[str] = None) -> Dict:
@@ -213,7 +334,7 @@ class InfrastructureBootstrap:
             # Invalidate cache since plugin enablement changed
             self.invalidate_structure_cache()
             # Refresh merged manifest
-            self.merged_manifest = self.plugin_system.get_merged_manifest(self.manifest)
+            self._refresh_merged_manifest()
         return success
     
     def disable_plugin(self, plugin_name: str) -> bool:
@@ -223,7 +344,7 @@ class InfrastructureBootstrap:
             # Invalidate cache since plugin enablement changed
             self.invalidate_structure_cache()
             # Refresh merged manifest
-            self.merged_manifest = self.plugin_system.get_merged_manifest(self.manifest)
+            self._refresh_merged_manifest()
         return success
     
     def get_plugin_installation_order(self, requested_plugins: List[str] = None) -> List[str]:
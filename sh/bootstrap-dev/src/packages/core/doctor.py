@@ -11,14 +11,68 @@ The doctor system can:
 - Repair corrupted or missing installations
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
+from ..domain.constants import MANIFEST_FILENAME, PLUGIN_MANIFEST_FILENAME
 from ..domain.model import Receipt, ComponentPlan
 from ..adapters.receipts import ReceiptsAdapter
 from ..adapters.hashing import HashingAdapter
 from ..adapters.logging import get_logger
 
+# Below this many files the thread pool costs more than it saves
+_PARALLEL_HASH_MIN_FILES = 4
+
+# Directories the orphan scan never descends into
+_SKIPPED_DIRS = frozenset({".git"})
+
+# System files the orphan scan ignores, by exact name or by suffix
+_IGNORED_NAMES = frozenset({".DS_Store", "Thumbs.db", ".git"})
+_IGNORED_SUFFIXES = (".tmp", ".temp")
+
+
+def _iter_files(root: str) -> Iterator[str]:
+    """Yield file paths under root in the same order as Path.rglob("*").
+
+    Uses os.scandir so file/dir checks come from the directory listing
+    instead of a stat per entry. Symlinked directories are not followed,
+    skipped directories are pruned, and unreadable directories are ignored.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Path strings of regular files (or symlinks to them)
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIPPED_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry.path
+        stack.extend(reversed(subdirs))
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None where Path.exists() would return False."""
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
 
 class DoctorDiagnostic:
     """Represents a single diagnostic finding."""
@@ -69,6 +123,21 @@ class Doctor:
         self.resolver = resolver
         self.template_repo = template_repo
         self.logger = get_logger(__name__)
+        # (path, mtime_ns, size) -> digest, so unchanged files are not re-read
+        self._hash_cache: Dict[Tuple[str, int, int], str] = {}
+        # Parsed manifest and plugins, each paired with the mtimes they were read at
+        self._manifest_cache: Optional[Tuple[int, Dict]] = None
+        self._plugins_cache: Optional[Tuple[Tuple[Tuple[str, int], ...], Dict[str, Dict]]] = None
+
+    def invalidate_caches(self) -> None:
+        """Drop cached hashes, manifest and plugins.
+
+        Manifest and plugin caches already refresh when their files change;
+        call this after editing template or plugin sources in-process.
+        """
+        self._hash_cache.clear()
+        self._manifest_cache = None
+        self._plugins_cache = None
 
     def diagnose(
         self,
@@ -109,19 +178,31 @@ class Doctor:
         else:
             check_components = installed_components
 
-        # Check each installed component
-        for component in check_components:
-            component_diagnostics = self._diagnose_component(
-                component,
-                include_drift=include_drift,
-                include_missing=include_missing,
-            )
-            diagnostics.extend(component_diagnostics)
+        # Read each receipt once; the component and orphan checks share them
+        receipts = {
+            component: self.receipts_adapter.read_receipt(component)
+            for component in (installed_components if include_orphans else check_components)
+        }
 
-        # Check for orphaned files if requested
-        if include_orphans:
-            orphan_diagnostics = self._diagnose_orphaned_files(installed_components)
-            diagnostics.extend(orphan_diagnostics)
+        try:
+            # Check each installed component
+            for component in check_components:
+                component_diagnostics = self._diagnose_component(
+                    component,
+                    include_drift=include_drift,
+                    include_missing=include_missing,
+                    receipts=receipts,
+                )
+                diagnostics.extend(component_diagnostics)
+
+            # Check for orphaned files if requested
+            if include_orphans:
+                orphan_diagnostics = self._diagnose_orphaned_files(
+                    installed_components, receipts=receipts
+                )
+                diagnostics.extend(orphan_diagnostics)
+        finally:
+            self.close()
 
         return diagnostics
 
@@ -130,6 +211,7 @@ class Doctor:
         component_name: str,
         include_drift: bool = True,
         include_missing: bool = True,
+        receipts: Optional[Dict[str, Optional[Receipt]]] = None,
     ) -> List[DoctorDiagnostic]:
         """Diagnose a single component.
 
@@ -137,6 +219,7 @@ class Doctor:
             component_name: Name of component to diagnose
             include_drift: Check for file content drift
             include_missing: Check for missing files
+            receipts: Receipts already read by diagnose(), keyed by component
 
         Returns:
             List of diagnostic findings for this component
@@ -145,7 +228,10 @@ class Doctor:
 
         try:
             # Get receipt
-            receipt = self.receipts_adapter.read_receipt(component_name)
+            if receipts is not None and component_name in receipts:
+                receipt = receipts[component_name]
+            else:
+                receipt = self.receipts_adapter.read_receipt(component_name)
             if not receipt:
                 diagnostics.append(DoctorDiagnostic(
                     severity="error",
@@ -169,69 +255,81 @@ class Doctor:
             # Handle both new domain format (list of FileAction) and adapter format (dict)
             if isinstance(receipt.files, list):
                 # Domain Receipt format - list of FileAction objects
-                for file_action in receipt.files:
-                    target_path = file_action.target_path
-
-                    # Check if file exists
-                    if not target_path.exists():
-                        if include_missing:
-                            diagnostics.append(DoctorDiagnostic(
-                                severity="error",
-                                component=component_name,
-                                message=f"Missing file: {target_path}",
-                                details={"path": str(target_path)},
-                                repairable=True,
-                            ))
-                        continue
-
-                    # Check file content drift
-                    if include_drift and file_action.target_hash:
-                        current_hash = self.hashing_adapter.hash_file(target_path)
-                        if current_hash != file_action.target_hash:
-                            diagnostics.append(DoctorDiagnostic(
-                                severity="warning",
-                                component=component_name,
-                                message=f"File content drift: {target_path}",
-                                details={
-                                    "path": str(target_path),
-                                    "expected_hash": file_action.target_hash,
-                                    "actual_hash": current_hash,
-                                },
-                                repairable=True,
-                            ))
-                            
+                entries = [
+                    (file_action.target_path, file_action.target_hash, None)
+                    for file_action in receipt.files
+                ]
             elif isinstance(receipt.files, dict):
                 # Adapter Receipt format - dict mapping paths to metadata
-                for file_path, file_metadata in receipt.files.items():
-                    target_path = self.target_dir / file_path
-
-                    # Check if file exists
-                    if not target_path.exists():
-                        if include_missing:
-                            diagnostics.append(DoctorDiagnostic(
-                                severity="error",
-                                component=component_name,
-                                message=f"Missing file: {target_path}",
-                                details={"path": str(target_path)},
-                                repairable=True,
-                            ))
-                        continue
-
-                    # Check file content drift
-                    if include_drift and file_metadata.get("hash"):
-                        current_hash = self.hashing_adapter.hash_file(target_path)
-                        if current_hash != file_metadata["hash"]:
-                            diagnostics.append(DoctorDiagnostic(
-                                severity="warning",
-                                component=component_name,
-                                message=f"File content drift: {target_path}",
-                                details={
-                                    "path": str(target_path),
-                                    "expected_hash": file_metadata["hash"],
-                                    "actual_hash": current_hash,
-                                },
-                                repairable=True,
-                            ))
+                entries = [
+                    (
+                        self.target_dir / file_path,
+                        file_metadata.get("hash"),
+                        file_metadata.get("size"),
+                    )
+                    for file_path, file_metadata in receipt.files.items()
+                ]
+            else:
+                entries = []
+
+            # Hash every present file up front so large components can be
+            # hashed concurrently, then report in receipt order. The stat
+            # that proves a file exists also keys its hash memo, and a size
+            # that differs from the receipt proves drift without hashing.
+            stats = [_stat_or_none(target_path) for target_path, _, _ in entries]
+            to_hash = [
+                (target_path, st)
+                for (target_path, expected_hash, expected_size), st in zip(entries, stats)
+                if st is not None and include_drift and expected_hash
+                and (expected_size is None or st.st_size == expected_size)
+            ]
+            current_hashes = dict(zip(
+                (target_path for target_path, _ in to_hash),
+                self._hash_files(to_hash),
+            ))
+
+            for (target_path, expected_hash, expected_size), st in zip(entries, stats):
+                # Check if file exists
+                if st is None:
+                    if include_missing:
+                        diagnostics.append(DoctorDiagnostic(
+                            severity="error",
+                            component=component_name,
+                            message=f"Missing file: {target_path}",
+                            details={"path": str(target_path)},
+                            repairable=True,
+                        ))
+                    continue
+
+                # Check file content drift
+                if target_path in current_hashes:
+                    current_hash = current_hashes[target_path]
+                    if current_hash != expected_hash:
+                        diagnostics.append(DoctorDiagnostic(
+                            severity="warning",
+                            component=component_name,
+                            message=f"File content drift: {target_path}",
+                            details={
+                                "path": str(target_path),
+                                "expected_hash": expected_hash,
+                                "actual_hash": current_hash,
+                            },
+                            repairable=True,
+                        ))
+                elif include_drift and expected_hash:
+                    # Not hashed because the size already differs
+                    diagnostics.append(DoctorDiagnostic(
+                        severity="warning",
+                        component=component_name,
+                        message=f"File content drift: {target_path}",
+                        details={
+                            "path": str(target_path),
+                            "expected_hash": expected_hash,
+                            "expected_size": expected_size,
+                            "actual_size": st.st_size,
+                        },
+                        repairable=True,
+                    ))
 
         except Exception as e:
             diagnostics.append(DoctorDiagnostic(
@@ -244,11 +342,63 @@ class Doctor:
 
         return diagnostics
 
-    def _diagnose_orphaned_files(self, installed_components: List[str]) -> List[DoctorDiagnostic]:
+    @cached_property
+    def _hash_executor(self) -> ThreadPoolExecutor:
+        """Thread pool shared by every component's drift check."""
+        return ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+    def close(self) -> None:
+        """Shut down the hash thread pool, if one was started.
+
+        A later drift check starts a fresh pool on demand.
+        """
+        executor = self.__dict__.pop("_hash_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _hash_files(self, files: List[Tuple[Path, os.stat_result]]) -> List[str]:
+        """Hash files in order, fanning larger batches out to the thread pool.
+
+        Args:
+            files: (path, stat) pairs of files to hash
+
+        Returns:
+            Hex digests in the same order as files
+        """
+        if len(files) < _PARALLEL_HASH_MIN_FILES:
+            return [self._cached_hash(path, st) for path, st in files]
+        paths, stats = zip(*files)
+        return list(self._hash_executor.map(self._cached_hash, paths, stats))
+
+    def _cached_hash(self, path: Path, st: Optional[os.stat_result] = None) -> str:
+        """Hash a file, reusing the digest while its mtime and size are unchanged.
+
+        Args:
+            path: File to hash
+            st: Stat already taken for path, to avoid another stat call
+
+        Returns:
+            SHA256 hex digest string
+        """
+        if st is None:
+            st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        digest = self._hash_cache.get(key)
+        if digest is None:
+            digest = self.hashing_adapter.hash_file(path)
+            self._hash_cache[key] = digest
+        return digest
+
+    def _diagnose_orphaned_files(
+        self,
+        installed_components: List[str],
+        receipts: Optional[Dict[str, Optional[Receipt]]] = None,
+    ) -> List[DoctorDiagnostic]:
         """Find files that exist but aren't tracked by any component.
 
         Args:
             installed_components: List of installed component names
+            receipts: Receipts already read by diagnose(), keyed by component
 
         Returns:
             List of diagnostics for orphaned files
@@ -261,7 +411,10 @@ class Doctor:
             
             # Add files from receipts (already installed)
             for component in installed_components:
-                receipt = self.receipts_adapter.read_receipt(component)
+                if receipts is not None and component in receipts:
+                    receipt = receipts[component]
+                else:
+                    receipt = self.receipts_adapter.read_receipt(component)
                 if receipt:
                     # Handle both new domain format (list of FileAction) and adapter format (dict)
                     if hasattr(receipt, 'files'):
@@ -278,6 +431,12 @@ class Doctor:
             if self.resolver:
                 tracked_files.update(self._get_manifest_tracked_files())
 
+            # Normalize once so relative receipt paths and absolute manifest
+            # paths compare equal to what the directory walk finds
+            tracked_norm = frozenset(
+                str((self.target_dir / path).resolve()) for path in tracked_files
+            )
+
             # Check common AI guardrails directories for orphaned files
             check_dirs = [
                 self.target_dir / ".ai",
@@ -287,7 +446,7 @@ class Doctor:
 
             for check_dir in check_dirs:
                 if check_dir.exists():
-                    orphaned = self._find_orphaned_in_directory(check_dir, tracked_files)
+                    orphaned = self._find_orphaned_in_directory(check_dir, tracked_norm)
                     for orphan_path in orphaned:
                         diagnostics.append(DoctorDiagnostic(
                             severity="warning",
@@ -318,8 +477,8 @@ class Doctor:
         
         try:
             # Load base manifest and plugins
-            manifest = self.resolver._load_manifest()
-            plugins = self.resolver._load_plugins()
+            manifest = self._load_manifest()
+            plugins = self._load_plugins()
             
             # Process base manifest components
             if 'components' in manifest:
@@ -339,6 +498,46 @@ class Doctor:
             
         return tracked_files
     
+    def _load_manifest(self) -> Dict:
+        """Load the base manifest, re-parsing only when its mtime changes.
+
+        Returns:
+            Parsed installation manifest
+        """
+        try:
+            mtime = os.stat(self.resolver.template_repo / MANIFEST_FILENAME).st_mtime_ns
+        except OSError:
+            # Let the resolver report the missing manifest
+            return self.resolver._load_manifest()
+
+        if self._manifest_cache is None or self._manifest_cache[0] != mtime:
+            self._manifest_cache = (mtime, self.resolver._load_manifest())
+        return self._manifest_cache[1]
+
+    def _load_plugins(self) -> Dict[str, Dict]:
+        """Load plugin manifests, re-parsing only when any of them changes.
+
+        Returns:
+            Plugin data keyed by plugin id, as returned by the resolver
+        """
+        plugins_dir = self.resolver.plugins_dir
+        signature = []
+        try:
+            names = sorted(os.listdir(plugins_dir))
+        except OSError:
+            names = []
+        for name in names:
+            try:
+                mtime = os.stat(plugins_dir / name / PLUGIN_MANIFEST_FILENAME).st_mtime_ns
+            except OSError:
+                continue
+            signature.append((name, mtime))
+        signature = tuple(signature)
+
+        if self._plugins_cache is None or self._plugins_cache[0] != signature:
+            self._plugins_cache = (signature, self.resolver._load_plugins())
+        return self._plugins_cache[1]
+
     def _expand_component_files(self, components: Dict, plugin_path: Optional[Path]) -> Set[Path]:
         """Expand component file patterns to target paths.
         
@@ -406,12 +605,14 @@ class Doctor:
                             
         return tracked_files
 
-    def _find_orphaned_in_directory(self, directory: Path, tracked_files: Set[Path]) -> List[Path]:
+    def _find_orphaned_in_directory(
+        self, directory: Path, tracked_files: FrozenSet[str]
+    ) -> List[Path]:
         """Find orphaned files in a specific directory.
 
         Args:
             directory: Directory to search
-            tracked_files: Set of files tracked by receipts
+            tracked_files: Resolved path strings of tracked files
 
         Returns:
             List of orphaned file paths
@@ -419,8 +620,17 @@ class Doctor:
         orphaned = []
 
         try:
-            for file_path in directory.rglob("*"):
-                if file_path.is_file() and file_path not in tracked_files:
+            # Resolve the directory once and splice walked paths onto it
+            # rather than resolving every entry. Tracked paths are fully
+            # resolved, so a miss (e.g. a symlinked file) is resolved before
+            # it counts as orphaned.
+            root = str(directory)
+            resolved_root = str(directory.resolve())
+            for path in _iter_files(root):
+                if resolved_root + path[len(root):] in tracked_files:
+                    continue
+                file_path = Path(path)
+                if str(file_path.resolve()) not in tracked_files:
                     # Skip certain system files
                     if not self._is_system_file(file_path):
                         orphaned.append(file_path)
@@ -431,7 +641,8 @@ class Doctor:
 
         return orphaned
 
-    def _is_system_file(self, file_path: Path) -> bool:
+    @staticmethod
+    def _is_system_file(file_path: Path) -> bool:
         """Check if a file is a system file that should be ignored.
 
         Args:
@@ -440,22 +651,8 @@ class Doctor:
         Returns:
             True if file should be ignored
         """
-        ignored_patterns = [
-            ".DS_Store",
-            "Thumbs.db",
-            "*.tmp",
-            "*.temp",
-            ".git",
-        ]
-
         file_name = file_path.name
-        for pattern in ignored_patterns:
-            if pattern.startswith("*") and file_name.endswith(pattern[1:]):
-                return True
-            elif file_name == pattern:
-                return True
-
-        return False
+        return file_name in _IGNORED_NAMES or file_name.endswith(_IGNORED_SUFFIXES)
 
     def _validate_receipt_structure(self, receipt: Receipt) -> bool:
         """Validate that a receipt has the expected structure.
@@ -14,7 +14,6 @@ Architecture:
 
 from pathlib import Path
 from typing import Dict, List
-import shutil
 
 from ..domain.model import InstallPlan, FileAction, Receipt
 from ..domain.errors import InstallationError, TransactionError
@@ -217,7 +216,7 @@ class Installer:
                 # Resolve relative source path to absolute path
                 resolved_source = self._resolve_source_path(action)
                     
-                shutil.copy2(resolved_source, target_path)
+                self.yaml_ops.copy_file(resolved_source, target_path)
 
             elif action.action_type == "MERGE":
                 # Resolve relative source path to absolute path
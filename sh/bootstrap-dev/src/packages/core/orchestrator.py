@@ -9,19 +9,27 @@ The orchestrator implements the complete pipeline:
 resolver → planner → installer with proper error handling and rollback.
 """
 
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from ..domain.model import InstallPlan
 from ..domain.errors import OrchestrationError
-from ..adapters.receipts import ReceiptsAdapter
-from ..adapters.yaml_ops import YamlOpsAdapter
-from ..adapters.hashing import HashingAdapter
 from ..adapters.logging import get_logger
 from .resolver import Resolver
-from .planner import Planner
-from .installer import Installer
-from .doctor import Doctor, DoctorDiagnostic
+
+if TYPE_CHECKING:
+    from ..adapters.receipts import ReceiptsAdapter
+    from ..adapters.yaml_ops import YamlOpsAdapter
+    from ..adapters.hashing import HashingAdapter
+    from .planner import Planner
+    from .installer import Installer
+    from .doctor import Doctor, DoctorDiagnostic
+
+# The template repo and plugins are part of the bootstrap system, not the target
+_SRC_DIR = Path(__file__).parent.parent.parent.parent / "src"
+_TEMPLATE_REPO = _SRC_DIR / "ai-guardrails-templates"
+_PLUGINS_DIR = _SRC_DIR / "plugins"
 
 
 class Orchestrator:
@@ -36,35 +44,62 @@ class Orchestrator:
         self.target_dir = Path(target_dir) if target_dir else Path.cwd()
         self.logger = get_logger(__name__)
 
-        # Initialize adapters
-        self.receipts_adapter = ReceiptsAdapter(self.target_dir)
-        self.yaml_ops = YamlOpsAdapter(target_dir=self.target_dir)
-        self.hashing_adapter = HashingAdapter()
-
-        # Initialize core components
-        # The template repo and plugins are part of the bootstrap system, not the target
-        bootstrap_root = Path(__file__).parent.parent.parent.parent
+        # The resolver is all that listing needs; adapters and the planner,
+        # installer and doctor services are imported and built on first use
         self.resolver = Resolver(
-            template_repo=bootstrap_root / "src",
-            plugins_dir=bootstrap_root / "src" / "plugins",
+            template_repo=_SRC_DIR,
+            plugins_dir=_PLUGINS_DIR,
         )
-        self.planner = Planner(
-            template_repo=bootstrap_root / "src" / "ai-guardrails-templates",
+
+    @cached_property
+    def receipts_adapter(self) -> "ReceiptsAdapter":
+        from ..adapters.receipts import ReceiptsAdapter
+
+        return ReceiptsAdapter(self.target_dir)
+
+    @cached_property
+    def yaml_ops(self) -> "YamlOpsAdapter":
+        from ..adapters.yaml_ops import YamlOpsAdapter
+
+        return YamlOpsAdapter(target_dir=self.target_dir)
+
+    @cached_property
+    def hashing_adapter(self) -> "HashingAdapter":
+        from ..adapters.hashing import HashingAdapter
+
+        return HashingAdapter()
+
+    @cached_property
+    def planner(self) -> "Planner":
+        from .planner import Planner
+
+        return Planner(
+            template_repo=_TEMPLATE_REPO,
             target_dir=self.target_dir,
         )
-        self.installer = Installer(
+
+    @cached_property
+    def installer(self) -> "Installer":
+        from .installer import Installer
+
+        return Installer(
             target_dir=self.target_dir,
             receipts_adapter=self.receipts_adapter,
             yaml_ops=self.yaml_ops,
-            template_repo=bootstrap_root / "src" / "ai-guardrails-templates",
-            plugins_dir=bootstrap_root / "src" / "plugins",
+            template_repo=_TEMPLATE_REPO,
+            plugins_dir=_PLUGINS_DIR,
         )
-        self.doctor_service = Doctor(
+
+    @cached_property
+    def doctor_service(self) -> "Doctor":
+        from .doctor import Doctor
+
+        return Doctor(
             target_dir=self.target_dir,
             receipts_adapter=self.receipts_adapter,
             hashing_adapter=self.hashing_adapter,
             resolver=self.resolver,
-            template_repo=bootstrap_root / "src" / "ai-guardrails-templates",
+            template_repo=_TEMPLATE_REPO,
         )
 
     def plan(
@@ -167,7 +202,7 @@ class Orchestrator:
         components: Optional[List[str]] = None,
         repair: bool = False,
         dry_run: bool = False,
-    ) -> List[DoctorDiagnostic]:
+    ) -> List["DoctorDiagnostic"]:
         """Run health checks on installed components.
 
         Args:
@@ -17,6 +17,7 @@ Features:
 """
 
 import json
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
@@ -27,6 +28,15 @@ import tempfile
 from ..domain.plugin_models import PluginManifest, PluginDependency
 from ..core.plugin_validator import PluginValidator
 
+# Optional binary sidecar for the index; index.json stays the canonical copy
+try:
+    import msgpack
+
+    _HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    _HAS_MSGPACK = False
+
 
 @dataclass
 class PluginSource:
@@ -101,6 +111,7 @@ class PluginRegistry:
         self.registry_dir.mkdir(parents=True, exist_ok=True)
 
         self.index_file = self.registry_dir / "index.json"
+        self.index_cache_file = self.registry_dir / "index.mpk"
         self.cache_dir = self.registry_dir / "cache"
         self.sources_file = self.registry_dir / "sources.json"
 
@@ -186,6 +197,11 @@ class PluginRegistry:
         """
         results = []
 
+        # Compiled once per search; a case-insensitive regex scan avoids
+        # lower-casing every name and description
+        match = re.compile(re.escape(query), re.IGNORECASE).search if query else None
+        wanted_tags = frozenset(tags) if tags else None
+
         for plugin_name, versions in self.index.plugins.items():
             if not versions:
                 continue
@@ -195,18 +211,17 @@ class PluginRegistry:
 
             # Apply filters
             if (
-                query
-                and query.lower() not in plugin_name.lower()
-                and query.lower() not in latest.description.lower()
+                match
+                and not match(plugin_name)
+                and not match(latest.description)
             ):
                 continue
 
             if author and latest.author != author:
                 continue
 
-            if tags:
-                if not any(tag in latest.tags for tag in tags):
-                    continue
+            if wanted_tags and wanted_tags.isdisjoint(latest.tags):
+                continue
 
             results.append(latest)
 
@@ -240,7 +255,11 @@ class PluginRegistry:
             return max(versions, key=lambda v: v.version)
 
     def install_plugin(
-        self, plugin_name: str, version: str = None, target_dir: Path = None
+        self,
+        plugin_name: str,
+        version: str = None,
+        target_dir: Path = None,
+        configuration: Optional[Dict] = None,
     ) -> bool:
         """
         Install plugin from registry.
@@ -249,6 +268,7 @@ class PluginRegistry:
             plugin_name: Name of plugin to install
             version: Specific version (or latest if None)
             target_dir: Target installation directory
+            configuration: Plugin configuration passed to the installer
 
         Returns:
             True if installation successful
@@ -292,7 +312,7 @@ class PluginRegistry:
                 plugin_path=plugin_path,
                 target_path=target_dir,
                 manifest=manifest,
-                configuration={},
+                configuration=configuration or {},
                 dry_run=False,
                 force=False,
             )
@@ -319,6 +339,7 @@ class PluginRegistry:
         """Update plugin index from all sources."""
         try:
             updated = False
+            refreshed = []
 
             for source in self.index.sources:
                 if not source.enabled:
@@ -330,20 +351,35 @@ class PluginRegistry:
 
                 self.logger.info(f"Updating index from source: {source.name}")
 
-                if source.type == "registry":
-                    if self._update_from_registry(source):
-                        updated = True
-                elif source.type == "local":
-                    if self._update_from_local(source):
-                        updated = True
-                elif source.type == "git":
-                    if self._update_from_git(source):
-                        updated = True
+                # A source whose update fails is left unstamped so the next
+                # call retries it instead of waiting out its cache_ttl
+                try:
+                    if source.type == "registry":
+                        if self._update_from_registry(source):
+                            updated = True
+                    elif source.type == "local":
+                        if self._update_from_local(source):
+                            updated = True
+                    elif source.type == "git":
+                        if self._update_from_git(source):
+                            updated = True
+                except Exception as e:
+                    self.logger.error(f"Failed to update from source {source.name}: {e}")
+                    continue
+
+                refreshed.append(source)
 
+            saved = True
             if updated:
                 self.index.last_updated = datetime.now()
-                self._save_index()
-                self.logger.info("Plugin index updated successfully")
+                saved = self._save_index()
+                if saved:
+                    self.logger.info("Plugin index updated successfully")
+
+            # Stamp only once the index holding the results has been saved
+            if saved:
+                for source in refreshed:
+                    self._mark_cache_fresh(source)
 
             return True
 
@@ -355,8 +391,7 @@ class PluginRegistry:
         """Load plugin index from disk."""
         if self.index_file.exists():
             try:
-                with open(self.index_file) as f:
-                    data = json.load(f)
+                data = self._read_index_data()
 
                 # Convert datetime strings back to datetime objects
                 if "last_updated" in data:
@@ -400,8 +435,32 @@ class PluginRegistry:
             version="1.0", last_updated=datetime.now(), plugins={}, sources=[]
         )
 
-    def _save_index(self):
-        """Save plugin index to disk."""
+    def _read_index_data(self) -> dict:
+        """Read the raw index, preferring the msgpack sidecar when it is current."""
+        if _HAS_MSGPACK:
+            try:
+                # A hand-edited or newer index.json wins over the sidecar
+                if (
+                    self.index_cache_file.stat().st_mtime_ns
+                    >= self.index_file.stat().st_mtime_ns
+                ):
+                    return msgpack.unpackb(
+                        self.index_cache_file.read_bytes(), raw=False
+                    )
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.debug(f"Ignoring unreadable index cache: {e}")
+
+        with open(self.index_file) as f:
+            return json.load(f)
+
+    def _save_index(self) -> bool:
+        """Save plugin index to disk.
+
+        Returns:
+            True if the index file was written
+        """
         try:
             # Convert to serializable format
             data = {
@@ -463,6 +522,17 @@ class PluginRegistry:
 
         except Exception as e:
             self.logger.error(f"Failed to save index: {e}")
+            return False
+
+        if _HAS_MSGPACK:
+            try:
+                self.index_cache_file.write_bytes(
+                    msgpack.packb(data, use_bin_type=True)
+                )
+            except Exception as e:
+                self.logger.debug(f"Failed to write index cache: {e}")
+
+        return True
 
     def _save_sources(self):
         """Save sources configuration."""
@@ -514,75 +584,97 @@ class PluginRegistry:
             return False
 
         try:
-            cache_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            return datetime.now() - cache_time < timedelta(seconds=source.cache_ttl)
+            cache_stat = cache_file.stat()
+            cache_time = datetime.fromtimestamp(cache_stat.st_mtime)
+            if datetime.now() - cache_time >= timedelta(seconds=source.cache_ttl):
+                return False
+
+            # A plugin added to a local source changes its directory mtime
+            if source.type == "local":
+                return Path(source.url).stat().st_mtime_ns < cache_stat.st_mtime_ns
+
+            return True
         except Exception:
             return False
 
+    def _mark_cache_fresh(self, source: PluginSource):
+        """Record that a source was scanned, so update_index skips it until the TTL expires."""
+        cache_file = self.cache_dir / f"{source.name}.json"
+        try:
+            with open(cache_file, "w") as f:
+                json.dump(
+                    {"source": source.name, "last_updated": datetime.now().isoformat()},
+                    f,
+                )
+        except OSError as e:
+            self.logger.debug(f"Failed to write cache marker for {source.name}: {e}")
+
     def _update_from_registry(self, source: PluginSource) -> bool:
         """Update index from remote registry."""
         # Implementation for remote registry updates
         return True
 
     def _update_from_local(self, source: PluginSource) -> bool:
-        """Update index from local plugin directory."""
-        try:
-            plugins_dir = Path(source.url)
-            if not plugins_dir.exists():
-                return False
+        """Update index from local plugin directory.
 
-            updated = False
+        Returns:
+            True if new plugin versions were added to the index
 
-            for plugin_dir in plugins_dir.iterdir():
-                if not plugin_dir.is_dir():
-                    continue
+        Raises:
+            OSError: If the plugin directory cannot be read
+        """
+        plugins_dir = Path(source.url)
+        if not plugins_dir.exists():
+            return False
 
-                manifest_file = plugin_dir / "plugin-manifest.yaml"
-                if not manifest_file.exists():
-                    continue
+        updated = False
 
-                try:
-                    import yaml
-
-                    with open(manifest_file) as f:
-                        manifest_data = yaml.safe_load(f)
-
-                    # Extract metadata
-                    plugin_meta = PluginMetadata(
-                        name=manifest_data.get("name", plugin_dir.name),
-                        version=manifest_data.get("version", "0.1.0"),
-                        description=manifest_data.get("description", ""),
-                        author=manifest_data.get("author", "Unknown"),
-                        license=manifest_data.get("license"),
-                        homepage=manifest_data.get("homepage"),
-                        tags=manifest_data.get("tags", []),
-                        source=source,
-                        last_updated=datetime.now(),
-                    )
+        for plugin_dir in plugins_dir.iterdir():
+            if not plugin_dir.is_dir():
+                continue
 
-                    # Add to index
-                    if plugin_meta.name not in self.index.plugins:
-                        self.index.plugins[plugin_meta.name] = []
+            manifest_file = plugin_dir / "plugin-manifest.yaml"
+            if not manifest_file.exists():
+                continue
 
-                    # Check if this version already exists
-                    existing = [
-                        p
-                        for p in self.index.plugins[plugin_meta.name]
-                        if p.version == plugin_meta.version
-                    ]
+            try:
+                import yaml
+
+                with open(manifest_file) as f:
+                    manifest_data = yaml.safe_load(f)
+
+                # Extract metadata
+                plugin_meta = PluginMetadata(
+                    name=manifest_data.get("name", plugin_dir.name),
+                    version=manifest_data.get("version", "0.1.0"),
+                    description=manifest_data.get("description", ""),
+                    author=manifest_data.get("author", "Unknown"),
+                    license=manifest_data.get("license"),
+                    homepage=manifest_data.get("homepage"),
+                    tags=manifest_data.get("tags", []),
+                    source=source,
+                    last_updated=datetime.now(),
+                )
 
-                    if not existing:
-                        self.index.plugins[plugin_meta.name].append(plugin_meta)
-                        updated = True
+                # Add to index
+                if plugin_meta.name not in self.index.plugins:
+                    self.index.plugins[plugin_meta.name] = []
 
-                except Exception as e:
-                    self.logger.warning(f"Failed to process plugin {plugin_dir}: {e}")
+                # Check if this version already exists
+                existing = [
+                    p
+                    for p in self.index.plugins[plugin_meta.name]
+                    if p.version == plugin_meta.version
+                ]
 
-            return updated
+                if not existing:
+                    self.index.plugins[plugin_meta.name].append(plugin_meta)
+                    updated = True
 
-        except Exception as e:
-            self.logger.error(f"Failed to update from local source {source.name}: {e}")
-            return False
+            except Exception as e:
+                self.logger.warning(f"Failed to process plugin {plugin_dir}: {e}")
+
+        return updated
 
     def _update_from_git(self, source: PluginSource) -> bool:
         """Update index from git repository."""
@@ -22,6 +22,12 @@ from ..adapters.logging import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml's C loader parses manifests several times faster when available
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ResolvedSpec:
     """Represents a fully resolved specification ready for planning.
@@ -192,8 +198,7 @@ class Resolver:
             )
 
         try:
-            with manifest_path.open() as f:
-                manifest = yaml.safe_load(f)
+            manifest = yaml.load(manifest_path.read_bytes(), Loader=_SafeLoader)
 
             # Basic validation
             self._validate_manifest(manifest, manifest_path)
@@ -233,8 +238,7 @@ class Resolver:
                 continue
 
             try:
-                with manifest_path.open() as f:
-                    plugin_manifest = yaml.safe_load(f)
+                plugin_manifest = yaml.load(manifest_path.read_bytes(), Loader=_SafeLoader)
 
                 # Basic validation
                 self._validate_plugin_manifest(plugin_manifest, manifest_path)
@@ -4,26 +4,7 @@ This package contains pure domain models, typed exceptions, and business rules
 that are free from infrastructure concerns and side effects.
 """
 
-from .model import (
-    ActionKind,
-    Reason,
-    FileAction,
-    ComponentPlan,
-    InstallPlan,
-)
-from .errors import (
-    BootstrapError,
-    ConflictError,
-    DepError,
-    DriftError,
-)
-from .constants import (
-    GUARDRAILS_DIR,
-    DEFAULT_PROFILE,
-    DEFAULT_FILE_MODE,
-    RECEIPT_DIR,
-    MANIFEST_FILENAME,
-)
+from .._lazy import lazy_exports
 
 __all__ = [
     # Models
@@ -44,3 +25,26 @@ __all__ = [
     "RECEIPT_DIR",
     "MANIFEST_FILENAME",
 ]
+
+# Exported name -> submodule. Resolved on first access so that importing
+# domain.errors or domain.constants (as the CLI does before any command
+# runs) does not also load the plan models.
+_EXPORTS = {
+    "ActionKind": ".model",
+    "Reason": ".model",
+    "FileAction": ".model",
+    "ComponentPlan": ".model",
+    "InstallPlan": ".model",
+    "BootstrapError": ".errors",
+    "ConflictError": ".errors",
+    "DepError": ".errors",
+    "DriftError": ".errors",
+    "GUARDRAILS_DIR": ".constants",
+    "DEFAULT_PROFILE": ".constants",
+    "DEFAULT_FILE_MODE": ".constants",
+    "RECEIPT_DIR": ".constants",
+    "MANIFEST_FILENAME": ".constants",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
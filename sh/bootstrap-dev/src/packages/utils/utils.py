@@ -1,4 +1,3 @@
-import yaml
 import glob
 
 PLUGIN_DIRS = [
@@ -38,6 +37,8 @@ class Colors:
 
 
 def discover_plugins():
+    import yaml
+
     manifests = []
     for pat in PLUGIN_DIRS:
         for path in glob.glob(pat):
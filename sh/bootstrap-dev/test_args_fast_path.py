@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test that the argv fast path parses exactly like argparse
+"""
+from pathlib import Path
+from unittest import mock
+
+from src.packages.cli import args as cli_args
+from src.packages.cli.args import BootstrapArgs, parse_args
+
+
+FAST_PATH_CASES = [
+    ["plan"],
+    ["install"],
+    ["doctor"],
+    ["doctor", "--repair"],
+    ["list", "--profiles"],
+    ["list", "--components"],
+    ["list", "--installed"],
+    ["uninstall", "--components", "a,b"],
+    ["uninstall", "--components=a,,b", "--keep-going"],
+    ["--profile", "full", "install"],
+    ["--profile=", "plan"],
+    ["--components", "core,scripts", "--dry-run", "install"],
+    ["--target-dir", "/tmp/target", "--manifest", "m.yaml", "doctor"],
+    ["--target-dir=/tmp/target", "--dry-run", "--force", "install"],
+    ["-v", "-q", "--verbose", "--quiet", "plan"],
+    ["--structured-logs", "--log-file", "log.txt", "--no-color", "list", "--profiles"],
+    ["--output-format", "json", "doctor", "--repair"],
+    ["--output-format=yaml", "list", "--installed"],
+    ["--components", "x", "uninstall", "--components", "y"],
+]
+
+
+def _argparse_only(argv):
+    """Parse argv with the fast path disabled."""
+    with mock.patch.object(cli_args, "_fast_parse", return_value=None):
+        return parse_args(argv)
+
+
+def test_fast_path_matches_argparse():
+    """Every case the fast path accepts must equal the argparse result"""
+    print("🔧 Testing argv fast path against argparse...")
+
+    # Both paths default target_dir to Path.cwd(); pin it rather than chdir
+    with mock.patch.object(Path, "cwd", return_value=Path("/work")):
+        for argv in FAST_PATH_CASES:
+            fast = cli_args._fast_parse(argv)
+            assert fast is not None, f"fast path declined {argv}"
+            assert BootstrapArgs(**fast) == _argparse_only(argv), argv
+
+    print(f"✅ {len(FAST_PATH_CASES)} argv cases parse identically")
+
+
+def test_find_command_tables_match_fast_path():
+    """_find_command must skip exactly the global options the fast path knows"""
+    assert cli_args._GLOBAL_VALUE_OPTIONS == set(cli_args._FAST_GLOBAL_VALUES)
+    assert cli_args._GLOBAL_FLAG_OPTIONS == set(cli_args._FAST_GLOBAL_FLAGS)
+    assert set(cli_args._FAST_COMMAND_FLAGS) == set(cli_args._SUBCOMMANDS)
+
+    with mock.patch.object(Path, "cwd", return_value=Path("/work")):
+        for argv in FAST_PATH_CASES:
+            assert cli_args._find_command(argv) == _argparse_only(argv).command, argv
+
+
+if __name__ == "__main__":
+    test_fast_path_matches_argparse()
+    test_find_command_tables_match_fast_path()
+    print("\n🎉 All argument parsing tests passed")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test the single-flight behaviour of the performance_optimizer cached decorator
+"""
+import threading
+import time
+
+from src.packages.adapters.performance_optimizer import cached
+
+
+def _run_threads(target, count):
+    """Start count threads running target, returning them unjoined."""
+    threads = [threading.Thread(target=target, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_concurrent_cold_key_computes_once():
+    """Callers racing on a cold key share one computation"""
+    print("🔧 Testing concurrent callers on a cold key...")
+
+    calls = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    @cached(ttl=60)
+    def load(name):
+        calls.append(name)
+        entered.set()
+        release.wait(5)
+        return f"loaded {name}"
+
+    results = []
+    leader = _run_threads(lambda: results.append(load("core")), 1)
+    assert entered.wait(5)
+    followers = _run_threads(lambda: results.append(load("core")), 4)
+    # Let the followers reach the in-flight wait before the leader finishes
+    time.sleep(0.2)
+    release.set()
+    for thread in leader + followers:
+        thread.join(5)
+
+    assert calls == ["core"], calls
+    assert results == ["loaded core"] * 5, results
+    print("✅ Cold key computed once for 5 callers")
+
+
+def test_leader_failure_lets_followers_retry():
+    """When the leading call raises, waiting callers run the function themselves"""
+    calls = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    @cached(ttl=60)
+    def load(name):
+        calls.append(name)
+        if len(calls) == 1:
+            entered.set()
+            release.wait(5)
+            raise RuntimeError("first load failed")
+        return f"loaded {name}"
+
+    results = []
+    errors = []
+
+    def call():
+        try:
+            results.append(load("core"))
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader = _run_threads(call, 1)
+    assert entered.wait(5)
+    followers = _run_threads(call, 3)
+    time.sleep(0.2)
+    release.set()
+    for thread in leader + followers:
+        thread.join(5)
+
+    assert errors == ["first load failed"], errors
+    assert results == ["loaded core"] * 3, results
+    # The failed key is not left in flight; later callers hit the cache
+    assert load("core") == "loaded core"
+
+
+def test_reentrant_call_on_same_key_does_not_block():
+    """A function that calls itself with the same key must not wait on itself"""
+
+    @cached(ttl=60, key_func=lambda depth: "shared")
+    def nested(depth):
+        return nested(depth - 1) + 1 if depth else 0
+
+    results = []
+    worker = _run_threads(lambda: results.append(nested(3)), 1)[0]
+    worker.join(5)
+
+    assert not worker.is_alive(), "re-entrant call deadlocked"
+    assert results == [3], results
+
+
+if __name__ == "__main__":
+    test_concurrent_cold_key_computes_once()
+    test_leader_failure_lets_followers_retry()
+    test_reentrant_call_on_same_key_does_not_block()
+    print("\n🎉 All cached decorator tests passed")
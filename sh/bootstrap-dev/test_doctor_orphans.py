@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the doctor's orphaned-file scan against symlinked paths
+"""
+import tempfile
+from pathlib import Path
+
+from src.packages.adapters.hashing import HashingAdapter
+from src.packages.adapters.receipts import Receipt, ReceiptsAdapter
+from src.packages.core.doctor import Doctor
+
+
+def _orphan_paths(target_dir, tracked):
+    """Run the orphan scan with one receipt tracking the given relative paths."""
+    receipt = Receipt("core")
+    for relative_path in tracked:
+        receipt.add_file(relative_path, "0" * 64, 0, 0o644, "COPY")
+
+    doctor = Doctor(target_dir, ReceiptsAdapter(target_dir), HashingAdapter())
+    diagnostics = doctor._diagnose_orphaned_files(["core"], receipts={"core": receipt})
+    return {Path(d.details["path"]).relative_to(target_dir).as_posix() for d in diagnostics}
+
+
+def test_tracked_symlink_is_not_orphaned():
+    """A tracked file that is itself a symlink is not reported"""
+    print("🔧 Testing orphan scan with a tracked symlink...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        target_dir = Path(temp_dir)
+        shared = target_dir / "shared"
+        shared.mkdir()
+        (shared / "rules.yaml").write_text("rules: []\n")
+
+        ai_dir = target_dir / ".ai"
+        ai_dir.mkdir()
+        (ai_dir / "rules.yaml").symlink_to(shared / "rules.yaml")
+        (ai_dir / "stray.yaml").write_text("stray: true\n")
+
+        orphans = _orphan_paths(target_dir, [".ai/rules.yaml"])
+        assert orphans == {".ai/stray.yaml"}, orphans
+
+    print("✅ Tracked symlink is not reported as orphaned")
+
+
+def test_tracked_file_under_symlinked_parent_is_not_orphaned():
+    """A tracked file reached through a symlinked .ai directory is not reported"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        target_dir = Path(temp_dir)
+        real_ai = target_dir / "store" / "ai"
+        real_ai.mkdir(parents=True)
+        (real_ai / "guardrails.yaml").write_text("version: 1\n")
+        (real_ai / "stray.yaml").write_text("stray: true\n")
+        (target_dir / ".ai").symlink_to(real_ai, target_is_directory=True)
+
+        orphans = _orphan_paths(target_dir, [".ai/guardrails.yaml"])
+        assert orphans == {".ai/stray.yaml"}, orphans
+
+
+if __name__ == "__main__":
+    test_tracked_symlink_is_not_orphaned()
+    test_tracked_file_under_symlinked_parent_is_not_orphaned()
+    print("\n🎉 All orphan scan tests passed")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test that streamed and in-memory receipt validation report the same errors
+"""
+import json
+from unittest import mock
+
+import pytest
+
+from src.packages.adapters import yaml_ops
+from src.packages.adapters.yaml_ops import YamlOpsAdapter
+
+
+VALID_HASH = "a" * 64
+_DROP = object()
+
+
+def _receipt(**overrides):
+    """A valid receipt dict with the given top-level fields replaced or removed."""
+    receipt = {
+        "component_id": "core",
+        "installed_at": "2024-01-01T12:00:00Z",
+        "manifest_hash": VALID_HASH,
+        "files": [
+            {"target_path": ".ai/a.yaml", "action_type": "copy", "content_hash": VALID_HASH},
+            {"target_path": ".ai/b", "action_type": "mkdir", "content_hash": VALID_HASH},
+        ],
+        "metadata": {"installer": "test", "ratio": 0.5, "tags": ["a", {"b": [1, 2]}]},
+    }
+    for field, value in overrides.items():
+        if value is _DROP:
+            del receipt[field]
+        else:
+            receipt[field] = value
+    return receipt
+
+
+RECEIPT_FIXTURES = {
+    "valid": _receipt(),
+    "valid_without_metadata": _receipt(metadata=_DROP),
+    "null_metadata": _receipt(metadata=None),
+    "empty_files": _receipt(files=[]),
+    "missing_fields": {"files": []},
+    "files_not_a_list": _receipt(files={"target_path": "x"}),
+    "empty_component_id": _receipt(component_id="  "),
+    "short_manifest_hash": _receipt(manifest_hash="abc"),
+    "non_hex_manifest_hash": _receipt(manifest_hash="z" * 64),
+    "numeric_manifest_hash": _receipt(manifest_hash=12),
+    "bad_timestamp": _receipt(installed_at="yesterday"),
+    "metadata_not_an_object": _receipt(metadata=["x"]),
+    "bad_file_actions": _receipt(files=[
+        "not an object",
+        7,
+        None,
+        ["nested", {"list": True}],
+        {"target_path": "x"},
+        {"target_path": "x", "action_type": "delete", "content_hash": VALID_HASH},
+        {"target_path": "x", "action_type": "copy", "content_hash": VALID_HASH,
+         "extra": {"deep": [{"deeper": 1.25}]}},
+    ]),
+}
+
+
+@pytest.mark.parametrize("streaming", [True, False], ids=["ijson", "fallback"])
+def test_bytes_validation_matches_dict_validation(streaming):
+    """Every fixture yields the same errors from both validators"""
+    if streaming and not yaml_ops._HAS_IJSON:
+        pytest.skip("ijson is not installed")
+    print(f"🔧 Testing receipt validation parity ({'ijson' if streaming else 'fallback'})...")
+
+    adapter = YamlOpsAdapter(".")
+    with mock.patch.object(yaml_ops, "_HAS_IJSON", streaming):
+        for name, receipt in RECEIPT_FIXTURES.items():
+            expected = adapter.validate_receipt_format(receipt)
+            raw = json.dumps(receipt).encode("utf-8")
+            assert adapter.validate_receipt_format_bytes(raw) == expected, name
+
+    print(f"✅ {len(RECEIPT_FIXTURES)} receipt fixtures report identical errors")
+
+
+@pytest.mark.parametrize("streaming", [True, False], ids=["ijson", "fallback"])
+def test_bytes_validation_rejects_non_objects(streaming):
+    """Malformed JSON and non-object documents are reported, not raised"""
+    if streaming and not yaml_ops._HAS_IJSON:
+        pytest.skip("ijson is not installed")
+
+    adapter = YamlOpsAdapter(".")
+    with mock.patch.object(yaml_ops, "_HAS_IJSON", streaming):
+        for raw in (b"[1, 2]", b'"receipt"', b"3"):
+            assert adapter.validate_receipt_format_bytes(raw) == ["Receipt must be a JSON object"]
+
+        errors = adapter.validate_receipt_format_bytes(b'{"component_id": ')
+        assert len(errors) == 1 and errors[0].startswith("Invalid JSON"), errors
+
+
+if __name__ == "__main__":
+    for streaming in (True, False):
+        test_bytes_validation_matches_dict_validation(streaming)
+        test_bytes_validation_rejects_non_objects(streaming)
+    print("\n🎉 All receipt validation tests passed")